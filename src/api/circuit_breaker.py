@@ -4,6 +4,8 @@ Protects against cascading failures and provides fallback mechanisms.
 """
 
 import asyncio
+import functools
+import sys
 import time
 from enum import Enum
 from typing import Dict, Any, Optional, Callable, Awaitable, TypeVar, Generic
@@ -16,6 +18,20 @@ logger = logging.getLogger(__name__)
 # Type variables for generic circuit breaker
 T = TypeVar('T')
 
+_NS_PER_SECOND = 1_000_000_000
+_RECENT_SUCCESS_WINDOW_NS = 60 * _NS_PER_SECOND  # Half-open successes count for a minute
+
+
+if sys.version_info >= (3, 11):
+    async def _await_with_timeout(awaitable: Awaitable[T], timeout: float) -> T:
+        """Await with a deadline; asyncio.timeout() cancels in place without wrapping a Task."""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+else:
+    async def _await_with_timeout(awaitable: Awaitable[T], timeout: float) -> T:
+        """Await with a deadline."""
+        return await asyncio.wait_for(awaitable, timeout=timeout)
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -37,15 +53,15 @@ class CircuitBreakerConfig:
 
 @dataclass
 class CircuitBreakerStats:
-    """Circuit breaker statistics."""
+    """Circuit breaker statistics. Timestamps are `time.monotonic_ns()` readings."""
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
     circuit_opened_count: int = 0
-    last_failure_time: Optional[float] = None
-    last_success_time: Optional[float] = None
+    last_failure_ns: Optional[int] = None
+    last_success_ns: Optional[int] = None
     current_state: CircuitState = CircuitState.CLOSED
-    state_changed_at: float = field(default_factory=time.time)
+    state_changed_ns: int = field(default_factory=time.monotonic_ns)
     recent_failures: deque = field(default_factory=lambda: deque(maxlen=100))
     recent_successes: deque = field(default_factory=lambda: deque(maxlen=100))
 
@@ -56,7 +72,12 @@ class CircuitBreakerOpenException(Exception):
 
 
 class CircuitBreaker(Generic[T]):
-    """Circuit breaker for protecting external service calls."""
+    """
+    Circuit breaker for protecting external service calls.
+    
+    Per-request bookkeeping (admission, counters, state transitions) never
+    suspends, so on a single event loop it runs atomically without a lock.
+    """
     
     def __init__(
         self,
@@ -78,24 +99,19 @@ class CircuitBreaker(Generic[T]):
     
     async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
         """Execute function with circuit breaker protection."""
-        async with self._lock:
-            await self._update_state()
-            
-            if self.stats.current_state == CircuitState.OPEN:
-                logger.warning(f"Circuit breaker '{self.name}' is OPEN, rejecting request")
-                if self.fallback_func:
-                    logger.info(f"Using fallback for '{self.name}'")
-                    return await self.fallback_func(*args, **kwargs)
-                raise CircuitBreakerOpenException(f"Circuit breaker '{self.name}' is open")
-            
-            # Track the request
-            self.stats.total_requests += 1
+        await self._update_state()
+        
+        if self.stats.current_state == CircuitState.OPEN:
+            return await self._reject(*args, **kwargs)
+        
+        # Track the request
+        self.stats.total_requests += 1
         
         # Execute the function with timeout
         try:
-            result = await asyncio.wait_for(
+            result = await _await_with_timeout(
                 func(*args, **kwargs),
-                timeout=self.config.request_timeout
+                self.config.request_timeout
             )
             await self._record_success()
             return result
@@ -104,13 +120,28 @@ class CircuitBreaker(Generic[T]):
             await self._record_failure(e)
             raise
     
+    async def _reject(self, *args, **kwargs) -> T:
+        """Answer a request refused while OPEN: use the fallback if there is one, else raise."""
+        logger.warning(f"Circuit breaker '{self.name}' is OPEN, rejecting request")
+        if self.fallback_func:
+            logger.info(f"Using fallback for '{self.name}'")
+            return await self.fallback_func(*args, **kwargs)
+        raise CircuitBreakerOpenException(f"Circuit breaker '{self.name}' is open")
+    
+    def _open_timeout_elapsed(self) -> bool:
+        """Whether the OPEN timeout has passed and a recovery probe is due."""
+        elapsed_ns = time.monotonic_ns() - self.stats.state_changed_ns
+        return elapsed_ns >= self.config.timeout * _NS_PER_SECOND
+    
+    def is_rejecting(self) -> bool:
+        """Whether a call made now would be rejected, checked without awaiting."""
+        return self.stats.current_state is CircuitState.OPEN and not self._open_timeout_elapsed()
+    
     async def _update_state(self):
         """Update circuit breaker state based on current conditions."""
-        current_time = time.time()
-        
         if self.stats.current_state == CircuitState.OPEN:
             # Check if we should transition to half-open
-            if current_time - self.stats.state_changed_at >= self.config.timeout:
+            if self._open_timeout_elapsed():
                 await self._transition_to_half_open()
         
         elif self.stats.current_state == CircuitState.CLOSED:
@@ -135,44 +166,44 @@ class CircuitBreaker(Generic[T]):
     
     async def _record_success(self):
         """Record a successful request."""
-        async with self._lock:
-            self.stats.successful_requests += 1
-            self.stats.last_success_time = time.time()
-            self.stats.recent_successes.append(time.time())
+        now = time.monotonic_ns()
+        self.stats.successful_requests += 1
+        self.stats.last_success_ns = now
+        self.stats.recent_successes.append(now)
+        
+        if self.stats.current_state == CircuitState.HALF_OPEN:
+            # Check if we have enough successes to close
+            recent_successes = sum(1 for t in self.stats.recent_successes 
+                                 if now - t < _RECENT_SUCCESS_WINDOW_NS)
             
-            if self.stats.current_state == CircuitState.HALF_OPEN:
-                # Check if we have enough successes to close
-                recent_successes = sum(1 for t in self.stats.recent_successes 
-                                     if time.time() - t < 60)  # Last minute
-                
-                if recent_successes >= self.config.success_threshold:
-                    await self._transition_to_closed()
+            if recent_successes >= self.config.success_threshold:
+                await self._transition_to_closed()
     
     async def _record_failure(self, exception: Exception):
         """Record a failed request."""
-        async with self._lock:
-            self.stats.failed_requests += 1
-            self.stats.last_failure_time = time.time()
-            self.stats.recent_failures.append(time.time())
-            
-            logger.warning(f"Circuit breaker '{self.name}' recorded failure", extra={
-                "exception": str(exception),
-                "failure_count": self.stats.failed_requests,
-                "current_state": self.stats.current_state.value
-            })
-            
-            if self.stats.current_state == CircuitState.HALF_OPEN:
-                # Any failure in half-open state should open the circuit
+        now = time.monotonic_ns()
+        self.stats.failed_requests += 1
+        self.stats.last_failure_ns = now
+        self.stats.recent_failures.append(now)
+        
+        logger.warning(f"Circuit breaker '{self.name}' recorded failure", extra={
+            "exception": str(exception),
+            "failure_count": self.stats.failed_requests,
+            "current_state": self.stats.current_state.value
+        })
+        
+        if self.stats.current_state == CircuitState.HALF_OPEN:
+            # Any failure in half-open state should open the circuit
+            await self._transition_to_open()
+        elif self.stats.current_state == CircuitState.CLOSED:
+            # Check if we should open
+            if await self._should_open():
                 await self._transition_to_open()
-            elif self.stats.current_state == CircuitState.CLOSED:
-                # Check if we should open
-                if await self._should_open():
-                    await self._transition_to_open()
     
     async def _transition_to_open(self):
         """Transition to OPEN state."""
         self.stats.current_state = CircuitState.OPEN
-        self.stats.state_changed_at = time.time()
+        self.stats.state_changed_ns = time.monotonic_ns()
         self.stats.circuit_opened_count += 1
         
         logger.error(f"Circuit breaker '{self.name}' OPENED", extra={
@@ -184,14 +215,14 @@ class CircuitBreaker(Generic[T]):
     async def _transition_to_half_open(self):
         """Transition to HALF_OPEN state."""
         self.stats.current_state = CircuitState.HALF_OPEN
-        self.stats.state_changed_at = time.time()
+        self.stats.state_changed_ns = time.monotonic_ns()
         
         logger.info(f"Circuit breaker '{self.name}' transitioned to HALF_OPEN")
     
     async def _transition_to_closed(self):
         """Transition to CLOSED state."""
         self.stats.current_state = CircuitState.CLOSED
-        self.stats.state_changed_at = time.time()
+        self.stats.state_changed_ns = time.monotonic_ns()
         
         logger.info(f"Circuit breaker '{self.name}' CLOSED (recovered)")
     
@@ -201,6 +232,13 @@ class CircuitBreaker(Generic[T]):
             return 1.0
         return self.stats.successful_requests / self.stats.total_requests
     
+    @staticmethod
+    def _wall_time(monotonic_ns: Optional[int]) -> Optional[float]:
+        """Convert a monotonic timestamp to Unix time, for reporting only."""
+        if monotonic_ns is None:
+            return None
+        return time.time() - (time.monotonic_ns() - monotonic_ns) / _NS_PER_SECOND
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get current circuit breaker statistics."""
         return {
@@ -211,10 +249,12 @@ class CircuitBreaker(Generic[T]):
             "failed_requests": self.stats.failed_requests,
             "success_rate": self._get_success_rate(),
             "circuit_opened_count": self.stats.circuit_opened_count,
-            "last_failure_time": self.stats.last_failure_time,
-            "last_success_time": self.stats.last_success_time,
-            "state_changed_at": self.stats.state_changed_at,
-            "time_in_current_state": time.time() - self.stats.state_changed_at,
+            "last_failure_time": self._wall_time(self.stats.last_failure_ns),
+            "last_success_time": self._wall_time(self.stats.last_success_ns),
+            "state_changed_at": self._wall_time(self.stats.state_changed_ns),
+            "time_in_current_state": (
+                (time.monotonic_ns() - self.stats.state_changed_ns) / _NS_PER_SECOND
+            ),
             "recent_failure_count": len(self.stats.recent_failures),
             "recent_success_count": len(self.stats.recent_successes)
         }
@@ -240,6 +280,11 @@ class CircuitBreakerRegistry:
         fallback_func: Optional[Callable] = None
     ) -> CircuitBreaker:
         """Get existing circuit breaker or create new one."""
+        # Existing breakers are served without the lock; only creation takes it
+        breaker = self._breakers.get(name)
+        if breaker is not None:
+            return breaker
+        
         async with self._lock:
             if name not in self._breakers:
                 self._breakers[name] = CircuitBreaker(
@@ -251,9 +296,8 @@ class CircuitBreakerRegistry:
     
     async def get_all_stats(self) -> Dict[str, Dict[str, Any]]:
         """Get statistics for all circuit breakers."""
-        async with self._lock:
-            return {name: breaker.get_stats() 
-                   for name, breaker in self._breakers.items()}
+        return {name: breaker.get_stats() 
+               for name, breaker in list(self._breakers.items())}
     
     async def reset_all(self):
         """Reset all circuit breakers."""
@@ -274,12 +318,21 @@ def circuit_breaker(
 ):
     """Decorator to add circuit breaker protection to async functions."""
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        breaker: Optional[CircuitBreaker] = None
+        
+        @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            breaker = await circuit_registry.get_or_create(
-                name=name,
-                config=config,
-                fallback_func=fallback_func
-            )
+            nonlocal breaker
+            # The registry never drops breakers, so look this one up once instead of per call
+            if breaker is None:
+                breaker = await circuit_registry.get_or_create(
+                    name=name,
+                    config=config,
+                    fallback_func=fallback_func
+                )
+            # Reject while OPEN without entering call(); CLOSED/HALF_OPEN take the full path
+            if breaker.is_rejecting():
+                return await breaker._reject(*args, **kwargs)
             return await breaker.call(func, *args, **kwargs)
         return wrapper
     return decorator
@@ -5,7 +5,7 @@ Includes rate limiting, request tracking, and error handling.
 
 import time
 import uuid
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Optional
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 
@@ -17,19 +17,41 @@ from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+class RateLimitStore:
+    """
+    Per-client request timestamps backing RateLimitMiddleware.
+    """
+    
+    def __init__(self):
+        self.minute_requests = defaultdict(deque)  # client_id -> timestamps
+        self.hour_requests = defaultdict(deque)
+    
+    def reset(self) -> None:
+        """Forget all recorded requests."""
+        self.minute_requests.clear()
+        self.hour_requests.clear()
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
     Rate limiting middleware with configurable limits per user/IP.
     """
     
-    def __init__(self, app: Callable, requests_per_minute: int = 60, requests_per_hour: int = 1000):
+    def __init__(
+        self,
+        app: Callable,
+        requests_per_minute: int = 60,
+        requests_per_hour: int = 1000,
+        store: Optional[RateLimitStore] = None
+    ):
         super().__init__(app)
         self.requests_per_minute = requests_per_minute
         self.requests_per_hour = requests_per_hour
         
-        # Store request timestamps per client
-        self.minute_requests = defaultdict(deque)  # client_id -> timestamps
-        self.hour_requests = defaultdict(deque)
+        # Store request timestamps per client; injectable so callers can inspect or reset it
+        self.store = store or RateLimitStore()
+        self.minute_requests = self.store.minute_requests
+        self.hour_requests = self.store.hour_requests
         
         logger.info(f"Rate limiting enabled: {requests_per_minute}/min, {requests_per_hour}/hour")
 
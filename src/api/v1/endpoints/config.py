@@ -2,7 +2,8 @@
 Configuration management endpoints for runtime configuration and validation.
 """
 
-from typing import Dict, Any
+import time
+from typing import Dict, Any, Callable, Tuple
 from fastapi import APIRouter, HTTPException, status, Depends
 from datetime import datetime
 
@@ -13,6 +14,67 @@ from ...core.logging import get_logger
 logger = get_logger(__name__)
 router = APIRouter(prefix="/config", tags=["configuration"])
 
+# Report name -> (config fingerprint, cached at, response body without timestamp)
+_REPORT_CACHE_TTL_SECONDS = 30.0
+_report_cache: Dict[str, Tuple[Tuple[Any, ...], float, Dict[str, Any]]] = {}
+
+
+def _cached_report(
+    name: str,
+    build: Callable[[], Dict[str, Any]],
+    cacheable: Callable[[Dict[str, Any]], bool] = lambda body: True
+) -> Dict[str, Any]:
+    """
+    Return a configuration report, rebuilding it only when its inputs changed or it expired.
+    
+    Reports rejected by `cacheable` (e.g. failed validations) are always rebuilt,
+    so a fixed configuration is picked up on the next request.
+    """
+    fingerprint = config_manager.fingerprint()
+    now = time.monotonic()
+    
+    entry = _report_cache.get(name)
+    if entry is not None and entry[0] == fingerprint and now - entry[1] < _REPORT_CACHE_TTL_SECONDS:
+        return entry[2]
+    
+    body = build()
+    if cacheable(body):
+        _report_cache[name] = (fingerprint, now, body)
+    else:
+        _report_cache.pop(name, None)
+    return body
+
+
+def _build_validation_report() -> Dict[str, Any]:
+    """Validation results for the current configuration."""
+    validation = config_manager.validate_configuration()
+    
+    return {
+        "environment": config_manager.environment.value,
+        "is_valid": validation.is_valid,
+        "validation_results": {
+            "errors": validation.errors,
+            "warnings": validation.warnings,
+            "recommendations": validation.recommendations
+        },
+        "summary": {
+            "error_count": len(validation.errors),
+            "warning_count": len(validation.warnings),
+            "recommendation_count": len(validation.recommendations)
+        }
+    }
+
+
+def _build_deployment_checklist() -> Dict[str, Any]:
+    """Deployment checklist for the current environment."""
+    checklist = config_manager.generate_deployment_checklist()
+    
+    return {
+        "environment": config_manager.environment.value,
+        "checklist": checklist,
+        "total_items": len(checklist)
+    }
+
 
 @router.get("/validate")
 async def validate_configuration():
@@ -23,23 +85,11 @@ async def validate_configuration():
         Configuration validation results with errors, warnings, and recommendations
     """
     try:
-        validation = config_manager.validate_configuration()
+        report = _cached_report(
+            "validate", _build_validation_report, cacheable=lambda body: body["is_valid"]
+        )
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "environment": config_manager.environment.value,
-            "is_valid": validation.is_valid,
-            "validation_results": {
-                "errors": validation.errors,
-                "warnings": validation.warnings,
-                "recommendations": validation.recommendations
-            },
-            "summary": {
-                "error_count": len(validation.errors),
-                "warning_count": len(validation.warnings),
-                "recommendation_count": len(validation.recommendations)
-            }
-        }
+        return {"timestamp": datetime.utcnow().isoformat(), **report}
         
     except Exception as e:
         logger.error(f"Configuration validation failed: {e}")
@@ -58,10 +108,13 @@ async def get_configuration_summary():
         Complete configuration summary with validation and deployment checklist
     """
     try:
-        summary = config_manager.export_config_summary()
-        summary["timestamp"] = datetime.utcnow().isoformat()
+        summary = _cached_report(
+            "summary",
+            config_manager.export_config_summary,
+            cacheable=lambda body: body["validation"]["is_valid"]
+        )
         
-        return summary
+        return {**summary, "timestamp": datetime.utcnow().isoformat()}
         
     except Exception as e:
         logger.error(f"Failed to get configuration summary: {e}")
@@ -80,14 +133,9 @@ async def get_deployment_checklist():
         Environment-specific deployment checklist
     """
     try:
-        checklist = config_manager.generate_deployment_checklist()
+        report = _cached_report("deployment-checklist", _build_deployment_checklist)
         
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "environment": config_manager.environment.value,
-            "checklist": checklist,
-            "total_items": len(checklist)
-        }
+        return {"timestamp": datetime.utcnow().isoformat(), **report}
         
     except Exception as e:
         logger.error(f"Failed to get deployment checklist: {e}")
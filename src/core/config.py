@@ -28,11 +28,16 @@ class Settings(BaseSettings):
     # Qdrant
     qdrant_url: str = Field(..., env="QDRANT_URL")
     qdrant_collection_name: str = Field(default="los_chunks", env="QDRANT_COLLECTION_NAME")
+    qdrant_prefer_grpc: bool = Field(default=False, env="QDRANT_PREFER_GRPC")
+    qdrant_pool_size: int = Field(default=100, env="QDRANT_POOL_SIZE")
     vector_dimension: int = Field(default=1024, env="VECTOR_DIMENSION")
     
     # LLM APIs
     gemini_api_key: str = Field(..., env="GEMINI_API_KEY")
+    gemini_requests_per_second: float = Field(default=5.0, gt=0, env="GEMINI_REQUESTS_PER_SECOND")
+    gemini_request_burst: int = Field(default=20, ge=1, env="GEMINI_REQUEST_BURST")
     ollama_url: str = Field(..., env="OLLAMA_URL")
+    ollama_max_connections: int = Field(default=100, env="OLLAMA_MAX_CONNECTIONS")
     
     # Langfuse
     langfuse_public_key: Optional[str] = Field(None, env="LANGFUSE_PUBLIC_KEY")
@@ -63,6 +68,9 @@ class Settings(BaseSettings):
     # Model Configuration (Fixed according to approved config)
     default_embedding_model: str = Field(default="bge-m3", env="DEFAULT_EMBEDDING_MODEL")
     english_embedding_model: str = Field(default="dengcao/Qwen3-Embedding-0.6B:F16", env="ENGLISH_EMBEDDING_MODEL")
+    embedding_batch_size: int = Field(default=32, env="EMBEDDING_BATCH_SIZE")
+    embedding_concurrency: int = Field(default=4, env="EMBEDDING_CONCURRENCY")
+    embedding_cache_size: int = Field(default=10000, env="EMBEDDING_CACHE_SIZE")
     thai_reranker_model: str = Field(default="bge-reranker-v2-m3", env="THAI_RERANKER_MODEL")
     english_reranker_model: str = Field(default="dengcao/Qwen3-Reranker-0.6B:F16", env="ENGLISH_RERANKER_MODEL")
     
@@ -3,10 +3,10 @@ Configuration manager for environment-specific settings and validation.
 """
 
 import os
-import yaml
-import json
+import copy
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -16,6 +16,21 @@ from .config import Settings, get_settings
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _yaml_codec():
+    """
+    Return PyYAML with its safe loader and dumper, importing it on first use.
+    
+    Only saving/loading environment configs needs YAML, so the import is kept
+    off the start-up path. Uses libyaml's C implementations when available.
+    """
+    import yaml
+    
+    if yaml.__with_libyaml__:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
 class Environment(Enum):
     """Supported environment types."""
     DEVELOPMENT = "development"
@@ -24,6 +39,104 @@ class Environment(Enum):
     PRODUCTION = "production"
 
 
+# Per-environment settings layered over the shared configuration template
+_ENVIRONMENT_OVERRIDES: Dict[Environment, Dict[str, Any]] = {
+    Environment.PRODUCTION: {
+        "force_https": True,
+        "api_rate_limit_per_minute": 60,
+        "api_rate_limit_per_hour": 1000,
+        "database_pool_size": 20,
+        "max_concurrent_jobs": 10,
+        "log_level": "WARNING",
+        "cors_origins": ["https://yourdomain.com"]
+    },
+    Environment.STAGING: {
+        "force_https": True,
+        "api_rate_limit_per_minute": 100,
+        "api_rate_limit_per_hour": 2000,
+        "database_pool_size": 15,
+        "max_concurrent_jobs": 8,
+        "log_level": "INFO",
+        "cors_origins": ["https://staging.yourdomain.com"]
+    },
+    Environment.DEVELOPMENT: {
+        "force_https": False,
+        "api_rate_limit_per_minute": 200,
+        "api_rate_limit_per_hour": 5000,
+        "database_pool_size": 10,
+        "max_concurrent_jobs": 5,
+        "log_level": "DEBUG",
+        "cors_origins": ["http://localhost:3000", "http://127.0.0.1:3000"]
+    },
+    Environment.TESTING: {
+        "force_https": False,
+        "api_rate_limit_per_minute": 500,
+        "api_rate_limit_per_hour": 10000,
+        "database_pool_size": 5,
+        "max_concurrent_jobs": 3,
+        "log_level": "ERROR",
+        "cors_origins": ["*"]
+    },
+}
+
+
+# Deployment checklist per environment (environments without one get an empty list)
+_DEPLOYMENT_CHECKLISTS: Dict[Environment, Tuple[str, ...]] = {
+    Environment.PRODUCTION: (
+        "✓ Set ENVIRONMENT=production",
+        "✓ Configure production database with strong credentials",
+        "✓ Set up SSL certificates (SSL_CERT_PATH, SSL_KEY_PATH)",
+        "✓ Generate secure SECRET_KEY (32+ characters)",
+        "✓ Set FORCE_HTTPS=true",
+        "✓ Configure specific CORS_ORIGINS (no wildcards)",
+        "✓ Set appropriate rate limits for production traffic",
+        "✓ Configure production Redis instance",
+        "✓ Set up production Qdrant instance",
+        "✓ Validate Gemini API key and quotas",
+        "✓ Configure Ollama models for production",
+        "✓ Set LOG_LEVEL to WARNING or ERROR",
+        "✓ Set up monitoring and health checks",
+        "✓ Configure backup strategies",
+        "✓ Set up log aggregation",
+        "✓ Review and test circuit breaker configurations"
+    ),
+    Environment.STAGING: (
+        "✓ Set ENVIRONMENT=staging",
+        "✓ Configure staging database",
+        "✓ Set up SSL for staging domain",
+        "✓ Generate staging SECRET_KEY",
+        "✓ Configure staging CORS_ORIGINS",
+        "✓ Test rate limiting configurations",
+        "✓ Verify all external service connections",
+        "✓ Run integration tests",
+        "✓ Test circuit breaker functionality",
+        "✓ Verify monitoring endpoints"
+    ),
+    Environment.DEVELOPMENT: (
+        "✓ Set ENVIRONMENT=development",
+        "✓ Configure local database",
+        "✓ Set up local Redis instance",
+        "✓ Configure local Qdrant instance",
+        "✓ Set up Ollama with required models",
+        "✓ Configure development API keys",
+        "✓ Set DEBUG=true for detailed logging",
+        "✓ Test all API endpoints",
+        "✓ Verify hot reload functionality"
+    ),
+}
+
+
+# Environment variables every deployment must set
+_REQUIRED_ENV_VARS: Tuple[str, ...] = (
+    "DATABASE_URL",
+    "REDIS_URL",
+    "QDRANT_URL",
+    "GEMINI_API_KEY",
+    "OLLAMA_URL",
+    "SECRET_KEY"
+)
+
+
 @dataclass
 class ValidationResult:
     """Configuration validation result."""
@@ -36,8 +149,10 @@ class ValidationResult:
 class ConfigurationManager:
     """Configuration manager with environment-specific handling."""
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional[Settings] = None, environ: Optional[Mapping[str, str]] = None):
         self.settings = settings or get_settings()
+        # Process environment checked for required variables; injectable for tests
+        self.environ = os.environ if environ is None else environ
         self.config_dir = Path(self.settings.config_dir)
         self.environment = Environment(self.settings.environment.lower())
         
@@ -122,18 +237,9 @@ class ConfigurationManager:
         recommendations = []
         
         # Required environment variables
-        required_vars = [
-            "DATABASE_URL",
-            "REDIS_URL", 
-            "QDRANT_URL",
-            "GEMINI_API_KEY",
-            "OLLAMA_URL",
-            "SECRET_KEY"
-        ]
-        
         missing_vars = []
-        for var in required_vars:
-            if not os.getenv(var):
+        for var in _REQUIRED_ENV_VARS:
+            if not self.environ.get(var):
                 missing_vars.append(var)
         
         if missing_vars:
@@ -190,132 +296,76 @@ class ConfigurationManager:
     
     def create_environment_config(self, environment: Environment) -> Dict[str, Any]:
         """Create environment-specific configuration template."""
+        return self.create_environment_configs([environment])[environment]
+    
+    def create_environment_configs(self, environments: List[Environment]) -> Dict[Environment, Dict[str, Any]]:
+        """Create configuration templates for several environments from one shared base."""
         base_config = {
-            "environment": environment.value,
-            "debug": environment in [Environment.DEVELOPMENT, Environment.TESTING],
             "app_name": "LOs Generation Pipeline",
             "version": "1.0.0"
         }
         
-        if environment == Environment.PRODUCTION:
-            base_config.update({
-                "force_https": True,
-                "api_rate_limit_per_minute": 60,
-                "api_rate_limit_per_hour": 1000,
-                "database_pool_size": 20,
-                "max_concurrent_jobs": 10,
-                "log_level": "WARNING",
-                "cors_origins": ["https://yourdomain.com"]
-            })
-        
-        elif environment == Environment.STAGING:
-            base_config.update({
-                "force_https": True,
-                "api_rate_limit_per_minute": 100,
-                "api_rate_limit_per_hour": 2000,
-                "database_pool_size": 15,
-                "max_concurrent_jobs": 8,
-                "log_level": "INFO",
-                "cors_origins": ["https://staging.yourdomain.com"]
-            })
-        
-        elif environment == Environment.DEVELOPMENT:
-            base_config.update({
-                "force_https": False,
-                "api_rate_limit_per_minute": 200,
-                "api_rate_limit_per_hour": 5000,
-                "database_pool_size": 10,
-                "max_concurrent_jobs": 5,
-                "log_level": "DEBUG",
-                "cors_origins": ["http://localhost:3000", "http://127.0.0.1:3000"]
-            })
-        
-        elif environment == Environment.TESTING:
-            base_config.update({
-                "force_https": False,
-                "api_rate_limit_per_minute": 500,
-                "api_rate_limit_per_hour": 10000,
-                "database_pool_size": 5,
-                "max_concurrent_jobs": 3,
-                "log_level": "ERROR",
-                "cors_origins": ["*"]
-            })
-        
-        return base_config
+        return {
+            environment: {
+                "environment": environment.value,
+                "debug": environment in (Environment.DEVELOPMENT, Environment.TESTING),
+                **base_config,
+                # Copied so callers can edit the lists without touching the shared table
+                **copy.deepcopy(_ENVIRONMENT_OVERRIDES[environment])
+            }
+            for environment in environments
+        }
+    
+    def _config_file(self, environment: Environment) -> Path:
+        """Path of the configuration file for an environment."""
+        return self.config_dir / f"{environment.value}.yaml"
+    
+    def fingerprint(self) -> Tuple[Any, ...]:
+        """
+        Snapshot of every input validation and the reports depend on.
+        
+        Compares unequal after settings are changed (even in place), a required
+        environment variable changes, or the environment's config file is written.
+        """
+        try:
+            config_mtime_ns = self._config_file(self.environment).stat().st_mtime_ns
+        except FileNotFoundError:
+            config_mtime_ns = None
+        
+        return (
+            self.settings.model_dump_json(),
+            self.environment,
+            tuple(self.environ.get(var) for var in _REQUIRED_ENV_VARS),
+            config_mtime_ns
+        )
     
     def save_environment_config(self, environment: Environment, config: Dict[str, Any]):
         """Save environment-specific configuration to file."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         
-        config_file = self.config_dir / f"{environment.value}.yaml"
+        config_file = self._config_file(environment)
         
+        yaml, _, dumper = _yaml_codec()
         with open(config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False, indent=2)
+            yaml.dump(config, f, Dumper=dumper, default_flow_style=False, indent=2)
         
         logger.info(f"Saved {environment.value} configuration to {config_file}")
     
     def load_environment_config(self, environment: Environment) -> Optional[Dict[str, Any]]:
         """Load environment-specific configuration from file."""
-        config_file = self.config_dir / f"{environment.value}.yaml"
-        
-        if not config_file.exists():
+        config_file = self._config_file(environment)
+        
+        yaml, loader, _ = _yaml_codec()
+        # Open directly rather than stat first; a missing file just means no config
+        try:
+            with open(config_file, 'r') as f:
+                return yaml.load(f, Loader=loader)
+        except FileNotFoundError:
             return None
-        
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
     
     def generate_deployment_checklist(self) -> List[str]:
         """Generate deployment checklist based on current environment."""
-        checklist = []
-        
-        if self.environment == Environment.PRODUCTION:
-            checklist = [
-                "✓ Set ENVIRONMENT=production",
-                "✓ Configure production database with strong credentials",
-                "✓ Set up SSL certificates (SSL_CERT_PATH, SSL_KEY_PATH)",
-                "✓ Generate secure SECRET_KEY (32+ characters)",
-                "✓ Set FORCE_HTTPS=true",
-                "✓ Configure specific CORS_ORIGINS (no wildcards)",
-                "✓ Set appropriate rate limits for production traffic",
-                "✓ Configure production Redis instance",
-                "✓ Set up production Qdrant instance",
-                "✓ Validate Gemini API key and quotas",
-                "✓ Configure Ollama models for production",
-                "✓ Set LOG_LEVEL to WARNING or ERROR",
-                "✓ Set up monitoring and health checks",
-                "✓ Configure backup strategies",
-                "✓ Set up log aggregation",
-                "✓ Review and test circuit breaker configurations"
-            ]
-        
-        elif self.environment == Environment.STAGING:
-            checklist = [
-                "✓ Set ENVIRONMENT=staging",
-                "✓ Configure staging database",
-                "✓ Set up SSL for staging domain",
-                "✓ Generate staging SECRET_KEY",
-                "✓ Configure staging CORS_ORIGINS",
-                "✓ Test rate limiting configurations",
-                "✓ Verify all external service connections",
-                "✓ Run integration tests",
-                "✓ Test circuit breaker functionality",
-                "✓ Verify monitoring endpoints"
-            ]
-        
-        elif self.environment == Environment.DEVELOPMENT:
-            checklist = [
-                "✓ Set ENVIRONMENT=development",
-                "✓ Configure local database",
-                "✓ Set up local Redis instance",
-                "✓ Configure local Qdrant instance",
-                "✓ Set up Ollama with required models",
-                "✓ Configure development API keys",
-                "✓ Set DEBUG=true for detailed logging",
-                "✓ Test all API endpoints",
-                "✓ Verify hot reload functionality"
-            ]
-        
-        return checklist
+        return list(_DEPLOYMENT_CHECKLISTS.get(self.environment, ()))
     
     def export_config_summary(self) -> Dict[str, Any]:
         """Export configuration summary for documentation."""
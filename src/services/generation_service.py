@@ -2,9 +2,12 @@
 Generation Service for Learning Objective creation with quality scoring and validation.
 """
 
+import copy
 import json
+import time
 import asyncio
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 import structlog
 
@@ -13,6 +16,13 @@ from .llm_service import LLMService
 from .vector_service import VectorService
 
 
+# Retrieved contexts are reused for repeated topics; generation itself is never cached.
+# Writes through our own VectorService change the cache key; the TTL bounds how long
+# chunks indexed by other processes (e.g. Celery workers) can stay invisible.
+_CONTEXT_CACHE_SIZE = 128
+_CONTEXT_CACHE_TTL_SECONDS = 60.0
+
+
 class GenerationService(BaseService):
     """Service for Learning Objective generation with quality scoring."""
     
@@ -21,6 +31,8 @@ class GenerationService(BaseService):
         self.llm_service = None
         self.vector_service = None
         self._generation_semaphore = None
+        self._context_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._context_inflight: Dict[Tuple, asyncio.Task] = {}
     
     async def _initialize(self) -> None:
         """Initialize generation service with dependencies."""
@@ -29,8 +41,11 @@ class GenerationService(BaseService):
             self.llm_service = LLMService()
             self.vector_service = VectorService()
             
-            await self.llm_service.initialize()
-            await self.vector_service.initialize()
+            # The LLM and vector backends are independent; bring them up concurrently
+            await asyncio.gather(
+                self.llm_service.initialize(),
+                self.vector_service.initialize()
+            )
             
             # Limit concurrent generations
             self._generation_semaphore = asyncio.Semaphore(self.settings.max_concurrent_jobs)
@@ -43,11 +58,16 @@ class GenerationService(BaseService):
     
     async def _shutdown(self) -> None:
         """Shutdown generation service and dependencies."""
+        self.clear_context_cache()
         if self.llm_service:
             await self.llm_service.shutdown()
         if self.vector_service:
             await self.vector_service.shutdown()
     
+    def clear_context_cache(self) -> None:
+        """Drop cached retrieval results, e.g. after new chunks have been indexed."""
+        self._context_cache.clear()
+    
     async def retrieve_context(
         self,
         topic: str,
@@ -56,6 +76,11 @@ class GenerationService(BaseService):
         """
         Retrieve relevant context for learning objective generation.
         
+        Successful retrievals are kept in a small LRU cache for up to a minute, and
+        concurrent requests for the same topic share a single vector search. Indexing
+        new chunks or changing the collection or the embedding model used for the
+        topic misses the cache. Every caller gets its own deep copy of the context.
+        
         Args:
             topic: Physics topic to search for
             max_chunks: Maximum number of chunks to retrieve
@@ -63,9 +88,55 @@ class GenerationService(BaseService):
         Returns:
             Retrieved context with chunks and metadata
         """
+        max_chunks = max_chunks or self.settings.max_retrieval_chunks
+        try:
+            # Key on the model the search will actually embed the topic with
+            vector_service = self.vector_service
+            embedding_model = vector_service._select_embedding_model(
+                vector_service._detect_language(topic)
+            )
+            key = (
+                topic,
+                max_chunks,
+                vector_service.collection_name,
+                vector_service.index_generation,
+                embedding_model
+            )
+        except Exception as e:
+            self.logger.warning("Context cache unavailable", topic=topic, error=str(e))
+            return await self._retrieve_context(topic, max_chunks)
+        
+        cached = self._context_cache.get(key)
+        if cached is not None:
+            cached_at, context = cached
+            if time.monotonic() - cached_at < _CONTEXT_CACHE_TTL_SECONDS:
+                self._context_cache.move_to_end(key)
+                return copy.deepcopy(context)
+            del self._context_cache[key]
+        
+        task = self._context_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_context(key, topic, max_chunks))
+            self._context_inflight[key] = task
+        
+        # Shielded so one cancelled caller does not cancel the search for the others
+        return copy.deepcopy(await asyncio.shield(task))
+    
+    async def _fetch_context(self, key: Tuple, topic: str, max_chunks: int) -> Dict[str, Any]:
+        """Run one retrieval and cache it if it produced usable context."""
+        try:
+            context = await self._retrieve_context(topic, max_chunks)
+            if context["context_text"] and "error" not in context:
+                self._context_cache[key] = (time.monotonic(), context)
+                if len(self._context_cache) > _CONTEXT_CACHE_SIZE:
+                    self._context_cache.popitem(last=False)
+            return context
+        finally:
+            self._context_inflight.pop(key, None)
+    
+    async def _retrieve_context(self, topic: str, max_chunks: int) -> Dict[str, Any]:
+        """Search the vector store and assemble context text for a topic."""
         try:
-            max_chunks = max_chunks or self.settings.max_retrieval_chunks
-            
             self.logger.info(
                 "Retrieving context for topic",
                 topic=topic,
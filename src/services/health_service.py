@@ -2,8 +2,9 @@
 Health Service for monitoring all system services and dependencies.
 """
 
+import time
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from datetime import datetime
 import structlog
 
@@ -14,6 +15,10 @@ from .processing_service import ProcessingService
 from .generation_service import GenerationService
 
 
+# Per-service results are reused briefly so overlapping status reports don't re-probe backends
+_HEALTH_CACHE_TTL_SECONDS = 2.0
+
+
 class HealthService(BaseService):
     """Service for system health monitoring and diagnostics."""
     
@@ -21,6 +26,7 @@ class HealthService(BaseService):
         super().__init__("HealthService")
         self.services = {}
         self.last_health_check = None
+        self._health_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     async def _initialize(self) -> None:
         """Initialize health monitoring service."""
@@ -61,6 +67,8 @@ class HealthService(BaseService):
         """
         Check health of a specific service.
         
+        Results are cached for a couple of seconds per service.
+        
         Args:
             service_name: Name of service to check
             
@@ -76,16 +84,23 @@ class HealthService(BaseService):
                     "checked_at": datetime.utcnow().isoformat()
                 }
             
+            cached = self._health_cache.get(service_name)
+            if cached is not None and time.monotonic() - cached[0] < _HEALTH_CACHE_TTL_SECONDS:
+                return cached[1]
+            
             service = self.services[service_name]
             health_result = await service.health_check()
             
-            return {
+            result = {
                 "service": service_name,
                 "status": health_result.get("status", "unknown"),
                 "message": health_result.get("message", "No message"),
                 "details": health_result,
                 "checked_at": datetime.utcnow().isoformat()
             }
+            self._health_cache[service_name] = (time.monotonic(), result)
+            
+            return result
             
         except Exception as e:
             self.logger.error(f"Health check failed for {service_name}", error=str(e))
@@ -108,14 +123,11 @@ class HealthService(BaseService):
             self.logger.info("Starting comprehensive health check")
             
             # Run health checks concurrently
-            health_tasks = {
-                service_name: self.check_service_health(service_name)
-                for service_name in self.services.keys()
-            }
-            
-            health_results = {}
-            for service_name, task in health_tasks.items():
-                health_results[service_name] = await task
+            service_names = list(self.services.keys())
+            health_results = dict(zip(
+                service_names,
+                await asyncio.gather(*(self.check_service_health(name) for name in service_names))
+            ))
             
             # Calculate overall system health
             healthy_count = sum(1 for result in health_results.values() 
@@ -273,16 +285,12 @@ class HealthService(BaseService):
             self.logger.info("Generating comprehensive system status")
             
             # Run all checks concurrently
-            services_health_task = self.check_all_services_health()
-            database_health_task = self.check_database_connectivity()
-            dependencies_health_task = self.check_external_dependencies()
-            metrics_task = self.get_system_metrics()
-            
-            # Wait for all checks to complete
-            services_health = await services_health_task
-            database_health = await database_health_task
-            dependencies_health = await dependencies_health_task
-            system_metrics = await metrics_task
+            services_health, database_health, dependencies_health, system_metrics = await asyncio.gather(
+                self.check_all_services_health(),
+                self.check_database_connectivity(),
+                self.check_external_dependencies(),
+                self.get_system_metrics()
+            )
             
             # Determine overall system status
             statuses = [
@@ -291,10 +291,16 @@ class JobService:
             ),
             processing_tasks.analyze_document.s(
                 job_id=job_id,
-                content_type="pdf"
+                content_type="pdf",
+                persist_state=True
             ),
-            processing_tasks.process_content_chunks.s(job_id=job_id),
-            processing_tasks.generate_embeddings.s(job_id=job_id),
+            processing_tasks.process_content_chunks.s(
+                job_id=job_id,
+                chunk_config=processing_preferences,
+                persist_state=True
+            ),
+            processing_tasks.generate_embeddings.s(job_id=job_id, persist_state=True),
+            processing_tasks.complete_processing_pipeline.s(job_id=job_id),
             generation_tasks.generate_learning_objectives.s(
                 job_id=job_id,
                 generation_config=generation_config
@@ -327,10 +333,16 @@ class JobService:
             processing_tasks.analyze_document.s(
                 job_id=job_id,
                 file_path=f"textbook_{textbook_id}",
-                content_type="textbook"
+                content_type="textbook",
+                persist_state=True
             ),
-            processing_tasks.process_content_chunks.s(job_id=job_id),
-            processing_tasks.generate_embeddings.s(job_id=job_id),
+            processing_tasks.process_content_chunks.s(
+                job_id=job_id,
+                chunk_config=processing_preferences,
+                persist_state=True
+            ),
+            processing_tasks.generate_embeddings.s(job_id=job_id, persist_state=True),
+            processing_tasks.complete_processing_pipeline.s(job_id=job_id),
             generation_tasks.generate_learning_objectives.s(
                 job_id=job_id,
                 generation_config=generation_config
@@ -2,8 +2,12 @@
 LLM Service for Gemini API integration with retry logic and error handling.
 """
 
+import json
+import time
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 import google.generativeai as genai
 from tenacity import retry, stop_after_attempt, wait_exponential
 import structlog
@@ -12,6 +16,78 @@ from .base import BaseService
 from ..api.circuit_breaker import circuit_breaker, CircuitBreakerConfig
 
 
+class LLMResponseCache:
+    """
+    In-process LRU cache of LLM responses for deterministic (temperature 0) requests.
+    """
+    
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+    
+    @staticmethod
+    def cache_key(model_type: str, prompt: str, params: Dict[str, Any]) -> Optional[str]:
+        """Return the cache key for a request, or None if its output may vary between calls."""
+        if params.get("temperature") != 0:
+            return None
+        
+        payload = json.dumps([model_type, prompt, params], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, text = entry
+        if time.monotonic() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return text
+    
+    def set(self, key: str, text: str) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        self._entries[key] = (time.monotonic(), text)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class TokenBucket:
+    """
+    Token bucket limiting how fast requests start, regardless of how many are in flight.
+    """
+    
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        if burst < 1:
+            raise ValueError(f"Token bucket burst must be at least 1, got {burst}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+    
+    async def acquire(self) -> None:
+        """Take one token, waiting until the bucket has refilled enough to cover it."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+        
+        # Reserve the token up front; callers past the burst wait out their share of the deficit in order
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class LLMService(BaseService):
     """Service for LLM operations using Gemini API."""
     
@@ -20,6 +96,11 @@ class LLMService(BaseService):
         self.generation_model = None
         self.validation_model = None
         self._rate_limiter = asyncio.Semaphore(10)  # Limit concurrent requests
+        self._request_bucket = TokenBucket(
+            self.settings.gemini_requests_per_second,
+            self.settings.gemini_request_burst
+        )  # Limit request rate
+        self._response_cache = LLMResponseCache()
     
     async def _initialize(self) -> None:
         """Initialize Gemini API clients."""
@@ -42,6 +123,7 @@ class LLMService(BaseService):
         """Shutdown LLM service."""
         self.generation_model = None
         self.validation_model = None
+        self._response_cache.clear()
     
     async def _test_connectivity(self) -> None:
         """Test Gemini API connectivity."""
@@ -77,6 +159,10 @@ class LLMService(BaseService):
         """
         Generate content using specified Gemini model.
         
+        Responses to temperature 0 requests are cached, so repeating an identical
+        deterministic prompt does not call the API again. Uncached requests are
+        paced by a token bucket to stay under the API's request rate limit.
+        
         Args:
             prompt: Input prompt for generation
             model_type: "generation" for 2.5-pro or "validation" for 2.5-flash
@@ -85,6 +171,22 @@ class LLMService(BaseService):
         Returns:
             Generated content string
         """
+        generation_params = {
+            "temperature": kwargs.get("temperature", 0.1),
+            "max_output_tokens": kwargs.get("max_tokens", 2048),
+            "top_p": kwargs.get("top_p", 0.8),
+            "top_k": kwargs.get("top_k", 40)
+        }
+        
+        cache_key = self._response_cache.cache_key(model_type, prompt, generation_params)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("LLM response cache hit", model_type=model_type)
+                return cached
+        
+        await self._request_bucket.acquire()
+        
         async with self._rate_limiter:
             try:
                 model = self.generation_model if model_type == "generation" else self.validation_model
@@ -100,12 +202,7 @@ class LLMService(BaseService):
                 
                 response = await model.generate_content_async(
                     prompt,
-                    generation_config=genai.types.GenerationConfig(
-                        temperature=kwargs.get("temperature", 0.1),
-                        max_output_tokens=kwargs.get("max_tokens", 2048),
-                        top_p=kwargs.get("top_p", 0.8),
-                        top_k=kwargs.get("top_k", 40)
-                    )
+                    generation_config=genai.types.GenerationConfig(**generation_params)
                 )
                 
                 if not response.text:
@@ -117,7 +214,11 @@ class LLMService(BaseService):
                     response_length=len(response.text)
                 )
                 
-                return response.text.strip()
+                text = response.text.strip()
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, text)
+                
+                return text
                 
             except Exception as e:
                 self.logger.error(
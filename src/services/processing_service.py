@@ -3,7 +3,9 @@ Processing Service for content ingestion, PDF processing, and hybrid chunking op
 Coordinates the hybrid chunking pipeline (structural vs OCR+agentic processing).
 """
 
+import re
 import hashlib
+import functools
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import fitz  # PyMuPDF
@@ -15,6 +17,31 @@ from .chunking_service import ChunkingService, HybridChunkingResult
 from .document_analyzer import ProcessingPath
 
 
+_THAI_CHAR = re.compile('[\u0e00-\u0e7f]')
+_ASCII_LETTER = re.compile('[A-Za-z]')
+
+# Only chunk-sized texts are cached so whole documents are never pinned in memory
+_LANGUAGE_CACHE_MAX_CHARS = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_language(text: str) -> Tuple[str, float]:
+    """Classify text as en/th/mixed from its Thai and ASCII letter ratios."""
+    thai_ratio = len(_THAI_CHAR.findall(text)) / len(text)
+    english_ratio = len(_ASCII_LETTER.findall(text)) / len(text)
+    
+    # Determine language based on character ratios
+    if thai_ratio > 0.3:
+        if english_ratio > 0.2:
+            return "mixed", max(thai_ratio, english_ratio)
+        else:
+            return "th", thai_ratio
+    elif english_ratio > 0.5:
+        return "en", english_ratio
+    else:
+        return "en", 0.5  # Default to English with moderate confidence
+
+
 class ProcessingService(BaseService):
     """Service for content processing and chunking operations."""
     
@@ -73,27 +100,10 @@ class ProcessingService(BaseService):
         if len(text.strip()) == 0:
             return "en", 0.0
         
-        # Count different character types
-        thai_chars = sum(1 for char in text if '\u0e00' <= char <= '\u0e7f')
-        english_chars = sum(1 for char in text if char.isascii() and char.isalpha())
-        total_chars = len(text)
-        
-        if total_chars == 0:
-            return "en", 0.0
-        
-        thai_ratio = thai_chars / total_chars
-        english_ratio = english_chars / total_chars
-        
-        # Determine language based on character ratios
-        if thai_ratio > 0.3:
-            if english_ratio > 0.2:
-                return "mixed", max(thai_ratio, english_ratio)
-            else:
-                return "th", thai_ratio
-        elif english_ratio > 0.5:
-            return "en", english_ratio
-        else:
-            return "en", 0.5  # Default to English with moderate confidence
+        # Repeated chunks (headers, boilerplate) reuse an earlier classification
+        if len(text) <= _LANGUAGE_CACHE_MAX_CHARS:
+            return _classify_language(text)
+        return _classify_language.__wrapped__(text)
     
     async def extract_text_from_pdf(self, pdf_path: str) -> Dict[str, Any]:
         """
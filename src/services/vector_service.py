@@ -3,9 +3,14 @@ Vector Service for Qdrant vector database operations with language-specific embe
 """
 
 import asyncio
+import functools
+import hashlib
+import re
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
 import httpx
 import numpy as np
+import orjson
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 import structlog
@@ -14,6 +19,110 @@ from .base import BaseService
 from ..api.circuit_breaker import circuit_breaker, CircuitBreakerConfig
 
 
+_THAI_RUN = re.compile('[\u0e00-\u0e7f]+')
+_ASCII_LETTER_RUN = re.compile('[A-Za-z]+')
+
+# Above this length one vectorised pass over the code points beats two regex scans
+_VECTOR_SCAN_MIN_CHARS = 160
+
+# Single and batch searches share one "qdrant_search" breaker, whichever registers it
+_SEARCH_BREAKER_CONFIG = CircuitBreakerConfig(
+    failure_threshold=5,
+    success_threshold=2,
+    timeout=30.0,
+    request_timeout=15.0
+)
+
+
+def _count_script_chars(text: str) -> Tuple[int, int]:
+    """Count Thai-block and ASCII letter characters in text."""
+    if len(text) < _VECTOR_SCAN_MIN_CHARS:
+        return (
+            len(text) - len(_THAI_RUN.sub('', text)),
+            len(text) - len(_ASCII_LETTER_RUN.sub('', text))
+        )
+    
+    code_points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    lowered = code_points | 0x20  # Folds A-Z onto a-z
+    thai = np.count_nonzero((code_points >= 0x0E00) & (code_points <= 0x0E7F))
+    ascii_letters = np.count_nonzero((lowered >= ord('a')) & (lowered <= ord('z')))
+    return int(thai), int(ascii_letters)
+
+
+def _bucket_by_length(texts: List[str], batch_size: int) -> List[np.ndarray]:
+    """
+    Split texts into batches of similar length.
+    
+    Returns index arrays into `texts`, shortest texts first, so each batch is
+    padded only to the longest text among its length-neighbours.
+    """
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    order = np.argsort(lengths, kind="stable")
+    return [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+
+def rerank(query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    Cosine similarity of each candidate row to the query vector.
+    
+    `candidates` is a (k, dim) array, scored with one matrix-vector product;
+    zero vectors score 0.
+    """
+    query = np.asarray(query, dtype=np.float32)
+    candidates = np.asarray(candidates, dtype=np.float32)
+    query_norm = np.linalg.norm(query)
+    candidate_norms = np.linalg.norm(candidates, axis=1)
+    denominators = candidate_norms * query_norm
+    return np.divide(
+        candidates @ query,
+        denominators,
+        out=np.zeros(len(candidates), dtype=np.float32),
+        where=denominators > 0
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_search_filter(conditions: Tuple[Tuple[str, Any], ...]) -> models.Filter:
+    """Build a Qdrant filter once per distinct set of key/value conditions."""
+    return models.Filter(must=[
+        models.FieldCondition(key=key, match=models.MatchValue(value=value))
+        for key, value in conditions
+    ])
+
+
+class EmbeddingCache:
+    """
+    In-process LRU cache of embeddings keyed by model and a digest of the text.
+    """
+    
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+    
+    @staticmethod
+    def cache_key(model: str, text: str) -> Tuple[str, bytes]:
+        """Return the cache key for embedding `text` with `model`."""
+        return model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+    
+    def get(self, key: Tuple[str, bytes]) -> Optional[np.ndarray]:
+        """Return a cached embedding, or None if missing."""
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+        return embedding
+    
+    def set(self, key: Tuple[str, bytes], embedding: np.ndarray) -> None:
+        """Store an embedding, evicting the least recently used entry when full."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached embeddings."""
+        self._entries.clear()
+
+
 class VectorService(BaseService):
     """Service for vector database operations using Qdrant."""
     
@@ -22,16 +131,29 @@ class VectorService(BaseService):
         self.qdrant_client = None
         self.ollama_client = None
         self.collection_name = None
+        self._embedding_cache = EmbeddingCache(self.settings.embedding_cache_size)
+        # Bumped on every write so cached search results can tell they are stale
+        self.index_generation = 0
     
     async def _initialize(self) -> None:
         """Initialize Qdrant and Ollama clients."""
         try:
             # Initialize Qdrant client
-            self.qdrant_client = AsyncQdrantClient(url=self.settings.qdrant_url)
+            self.qdrant_client = AsyncQdrantClient(
+                url=self.settings.qdrant_url,
+                prefer_grpc=self.settings.qdrant_prefer_grpc,
+                pool_size=self.settings.qdrant_pool_size
+            )
             self.collection_name = self.settings.qdrant_collection_name
             
-            # Initialize Ollama HTTP client
-            self.ollama_client = httpx.AsyncClient(base_url=self.settings.ollama_url)
+            # Initialize Ollama HTTP client, pooled for concurrent embedding requests
+            self.ollama_client = httpx.AsyncClient(
+                base_url=self.settings.ollama_url,
+                limits=httpx.Limits(
+                    max_connections=self.settings.ollama_max_connections,
+                    max_keepalive_connections=self.settings.ollama_max_connections // 2
+                )
+            )
             
             # Test connections
             await self._test_connections()
@@ -49,6 +171,7 @@ class VectorService(BaseService):
             await self.qdrant_client.close()
         if self.ollama_client:
             await self.ollama_client.aclose()
+        self._embedding_cache.clear()
     
     async def _test_connections(self) -> None:
         """Test Qdrant and Ollama connectivity."""
@@ -84,6 +207,14 @@ class VectorService(BaseService):
                         size=self.settings.vector_dimension,
                         distance=models.Distance.COSINE,
                     ),
+                    # int8 copies kept in RAM for search; 4x smaller than the float32 vectors
+                    quantization_config=models.ScalarQuantization(
+                        scalar=models.ScalarQuantizationConfig(
+                            type=models.ScalarType.INT8,
+                            quantile=0.99,
+                            always_ram=True,
+                        ),
+                    ),
                 )
                 
                 self.logger.info("Vector collection created successfully")
@@ -103,21 +234,29 @@ class VectorService(BaseService):
             request_timeout=30.0
         )
     )
-    async def generate_embedding(self, text: str, language: str = "en") -> List[float]:
+    async def generate_embedding(self, text: str, language: str = "en") -> np.ndarray:
         """
         Generate embedding for text using appropriate language-specific model.
         
+        Embeddings are cached per model and text, so repeated queries and
+        re-indexed chunks skip the Ollama round-trip.
+        
         Args:
             text: Text to embed
             language: Language code (en/th/mixed)
             
         Returns:
-            Embedding vector as list of floats
+            Read-only float32 embedding vector
         """
         try:
             # Select model based on language
             model = self._select_embedding_model(language)
             
+            cache_key = self._embedding_cache.cache_key(model, text)
+            cached = self._embedding_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            
             self.logger.info(
                 "Generating embedding", 
                 text_length=len(text),
@@ -138,17 +277,28 @@ class VectorService(BaseService):
             if response.status_code != 200:
                 raise Exception(f"Ollama embedding API returned status {response.status_code}")
             
-            result = response.json()
+            # orjson decodes the float array several times faster than response.json()
+            result = orjson.loads(response.content)
             embedding = result.get("embedding")
             
             if not embedding:
                 raise Exception("No embedding returned from Ollama API")
             
+            # Contiguous float32 from here on; converted back to a list only for Qdrant
+            embedding = np.asarray(embedding, dtype=np.float32)
+            if embedding.shape != (self.settings.vector_dimension,):
+                raise Exception(
+                    f"Ollama returned a {embedding.size}-dimensional embedding, "
+                    f"expected {self.settings.vector_dimension}"
+                )
+            embedding.flags.writeable = False  # Shared through the embedding cache
+            
             self.logger.info(
                 "Embedding generated successfully",
                 embedding_dimension=len(embedding)
             )
             
+            self._embedding_cache.set(cache_key, embedding)
             return embedding
             
         except Exception as e:
@@ -160,6 +310,120 @@ class VectorService(BaseService):
             )
             raise
     
+    async def generate_embeddings(self, texts: List[str], language: str = "en") -> List[np.ndarray]:
+        """
+        Generate embeddings for several texts, one Ollama request per batch.
+        
+        Texts are sent in batches of `embedding_batch_size`, up to
+        `embedding_concurrency` at a time, so a large input costs a handful of
+        concurrent round-trips instead of one per text. Batches are
+        bucketed by text length to keep padding inside each batch small, and
+        only texts missing from the embedding cache are sent.
+        
+        Args:
+            texts: Texts to embed
+            language: Language code (en/th/mixed) shared by all texts
+            
+        Returns:
+            One read-only float32 embedding vector per text, in input order
+        """
+        model = self._select_embedding_model(language)
+        cache_keys = [self._embedding_cache.cache_key(model, text) for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [
+            self._embedding_cache.get(key) for key in cache_keys
+        ]
+        
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        missing_texts = [texts[i] for i in missing]
+        
+        # Batches run concurrently, bounded so Ollama is not flooded
+        concurrency = asyncio.Semaphore(self.settings.embedding_concurrency)
+        
+        async def embed_bucket(bucket: np.ndarray) -> None:
+            async with concurrency:
+                batch_embeddings = await self._embed_batch(
+                    [missing_texts[j] for j in bucket], language
+                )
+            
+            # Scatter back so results follow input order
+            for j, embedding in zip(bucket.tolist(), batch_embeddings):
+                i = missing[j]
+                embeddings[i] = embedding
+                self._embedding_cache.set(cache_keys[i], embedding)
+        
+        tasks = [
+            asyncio.ensure_future(embed_bucket(bucket))
+            for bucket in _bucket_by_length(missing_texts, self.settings.embedding_batch_size)
+        ]
+        
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # One failed batch fails the call, so stop the batches still waiting or in flight
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        return embeddings
+    
+    @circuit_breaker(
+        name="ollama_embeddings",
+        config=CircuitBreakerConfig(
+            failure_threshold=5,
+            success_threshold=3,
+            timeout=60.0,
+            request_timeout=30.0
+        )
+    )
+    async def _embed_batch(self, texts: List[str], language: str) -> np.ndarray:
+        """Embed one batch of texts in a single Ollama request, one float32 row per text."""
+        try:
+            model = self._select_embedding_model(language)
+            
+            self.logger.info(
+                "Generating embeddings batch",
+                batch_size=len(texts),
+                language=language,
+                model=model
+            )
+            
+            # /api/embed accepts a list of inputs and embeds them in one forward pass
+            response = await self.ollama_client.post(
+                "/api/embed",
+                json={
+                    "model": model,
+                    "input": texts
+                },
+                timeout=30.0
+            )
+            
+            if response.status_code != 200:
+                raise Exception(f"Ollama embedding API returned status {response.status_code}")
+            
+            embeddings = orjson.loads(response.content).get("embeddings")
+            
+            if not embeddings or len(embeddings) != len(texts):
+                raise Exception("Ollama embedding API returned an incomplete batch")
+            
+            embeddings = np.asarray(embeddings, dtype=np.float32)
+            if embeddings.shape != (len(texts), self.settings.vector_dimension):
+                raise Exception(
+                    f"Ollama returned {embeddings.shape[-1]}-dimensional embeddings, "
+                    f"expected {self.settings.vector_dimension}"
+                )
+            embeddings.flags.writeable = False  # Rows are shared through the embedding cache
+            
+            return embeddings
+            
+        except Exception as e:
+            self.logger.error(
+                "Batch embedding generation failed",
+                batch_size=len(texts),
+                language=language,
+                error=str(e)
+            )
+            raise
+    
     def _select_embedding_model(self, language: str) -> str:
         """Select appropriate embedding model based on language."""
         if language == "en":
@@ -172,9 +436,7 @@ class VectorService(BaseService):
     
     def _detect_language(self, text: str) -> str:
         """Simple language detection based on character analysis."""
-        # Count Thai characters
-        thai_chars = sum(1 for char in text if '\u0e00' <= char <= '\u0e7f')
-        english_chars = sum(1 for char in text if char.isascii() and char.isalpha())
+        thai_chars, english_chars = _count_script_chars(text)
         
         total_chars = thai_chars + english_chars
         if total_chars == 0:
@@ -193,7 +455,9 @@ class VectorService(BaseService):
         self, 
         chunk_id: str, 
         text: str, 
-        metadata: Dict[str, Any]
+        metadata: Dict[str, Any],
+        language: Optional[str] = None,
+        wait: bool = True
     ) -> bool:
         """
         Index a single chunk in the vector database.
@@ -202,19 +466,22 @@ class VectorService(BaseService):
             chunk_id: Unique identifier for the chunk
             text: Text content to embed and index
             metadata: Additional metadata to store with the vector
+            language: Language code if already known; detected from text otherwise
+            wait: Wait until Qdrant has applied the write; pass False for bulk
+                ingestion and call `flush` once at the end
             
         Returns:
             True if indexing successful
         """
         try:
-            # Detect language and generate embedding
-            language = self._detect_language(text)
+            # Detect language (unless given) and generate embedding
+            language = language or self._detect_language(text)
             embedding = await self.generate_embedding(text, language)
             
             # Prepare point for insertion
             point = models.PointStruct(
                 id=chunk_id,
-                vector=embedding,
+                vector=embedding.tolist(),
                 payload={
                     "text": text,
                     "language": language,
@@ -225,8 +492,10 @@ class VectorService(BaseService):
             # Insert into Qdrant
             await self.qdrant_client.upsert(
                 collection_name=self.collection_name,
-                points=[point]
+                points=[point],
+                wait=wait
             )
+            self.index_generation += 1
             
             self.logger.info(
                 "Chunk indexed successfully",
@@ -244,21 +513,93 @@ class VectorService(BaseService):
             )
             return False
     
-    @circuit_breaker(
-        name="qdrant_search",
-        config=CircuitBreakerConfig(
-            failure_threshold=5,
-            success_threshold=2,
-            timeout=30.0,
-            request_timeout=15.0
+    async def index_chunks(self, chunks: List[Dict[str, Any]], wait: bool = True) -> int:
+        """
+        Index several chunks with one embedding request per language and a single upsert.
+        
+        Args:
+            chunks: Dicts with chunk_id, text and metadata keys, and an optional
+                language key that skips detection for that chunk
+            wait: Wait until Qdrant has applied the write; pass False for bulk
+                ingestion and call `flush` once at the end
+            
+        Returns:
+            Number of chunks indexed (0 if the batch failed)
+        """
+        if not chunks:
+            return 0
+        
+        try:
+            # Embedding models are chosen per language, so batch within each language
+            by_language: Dict[str, List[Dict[str, Any]]] = {}
+            for chunk in chunks:
+                language = chunk.get("language") or self._detect_language(chunk["text"])
+                by_language.setdefault(language, []).append(chunk)
+            
+            points = []
+            for language, group in by_language.items():
+                embeddings = await self.generate_embeddings(
+                    [chunk["text"] for chunk in group], language
+                )
+                points.extend(
+                    models.PointStruct(
+                        id=chunk["chunk_id"],
+                        vector=embedding.tolist(),
+                        payload={
+                            "text": chunk["text"],
+                            "language": language,
+                            **chunk["metadata"]
+                        }
+                    )
+                    for chunk, embedding in zip(group, embeddings)
+                )
+            
+            await self.qdrant_client.upsert(
+                collection_name=self.collection_name,
+                points=points,
+                wait=wait
+            )
+            self.index_generation += 1
+            
+            self.logger.info(
+                "Chunks indexed successfully",
+                chunk_count=len(points),
+                languages=list(by_language)
+            )
+            
+            return len(points)
+            
+        except Exception as e:
+            self.logger.error(
+                "Batch chunk indexing failed",
+                chunk_count=len(chunks),
+                error=str(e)
+            )
+            return 0
+    
+    async def flush(self) -> None:
+        """
+        Wait until every earlier write to the collection has been applied.
+        
+        Qdrant applies a collection's updates in order, so an empty upsert
+        with wait=True returns only after all pending `wait=False` writes.
+        """
+        await self.qdrant_client.upsert(
+            collection_name=self.collection_name,
+            points=[],
+            wait=True
         )
-    )
+        # Writes made with wait=False are only now guaranteed to be searchable
+        self.index_generation += 1
+    
+    @circuit_breaker(name="qdrant_search", config=_SEARCH_BREAKER_CONFIG)
     async def search_similar(
         self,
         query_text: str,
         limit: int = 10,
         score_threshold: float = 0.7,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        language: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Search for similar chunks based on semantic similarity.
@@ -268,13 +609,14 @@ class VectorService(BaseService):
             limit: Maximum number of results to return
             score_threshold: Minimum similarity score threshold
             filters: Optional metadata filters
+            language: Query language code if already known; detected otherwise
             
         Returns:
             List of similar chunks with scores and metadata
         """
         try:
-            # Detect language and generate query embedding
-            language = self._detect_language(query_text)
+            # Detect language (unless given) and generate query embedding
+            language = language or self._detect_language(query_text)
             query_embedding = await self.generate_embedding(query_text, language)
             
             self.logger.info(
@@ -284,40 +626,17 @@ class VectorService(BaseService):
                 limit=limit
             )
             
-            # Build search filters
-            search_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(models.FieldCondition(
-                        key=key,
-                        match=models.MatchValue(value=value)
-                    ))
-                
-                if conditions:
-                    search_filter = models.Filter(must=conditions)
-            
-            # Perform search
-            search_results = await self.qdrant_client.search(
+            # Perform search (query_points supersedes the removed client.search)
+            response = await self.qdrant_client.query_points(
                 collection_name=self.collection_name,
-                query_vector=query_embedding,
-                query_filter=search_filter,
+                query=query_embedding.tolist(),
+                query_filter=self._build_search_filter(filters),
                 limit=limit,
                 score_threshold=score_threshold,
                 with_payload=True
             )
             
-            # Format results
-            results = []
-            for result in search_results:
-                results.append({
-                    "id": result.id,
-                    "score": result.score,
-                    "text": result.payload.get("text", ""),
-                    "language": result.payload.get("language", "unknown"),
-                    "metadata": {k: v for k, v in result.payload.items() 
-                               if k not in ["text", "language"]}
-                })
+            results = self._format_search_results(response.points)
             
             self.logger.info(
                 "Similarity search completed",
@@ -334,6 +653,107 @@ class VectorService(BaseService):
             )
             return []
     
+    @circuit_breaker(name="qdrant_search", config=_SEARCH_BREAKER_CONFIG)
+    async def search_similar_batch(
+        self,
+        query_texts: List[str],
+        limit: int = 10,
+        score_threshold: float = 0.7,
+        filters: Optional[Dict[str, Any]] = None,
+        language: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for chunks similar to each of several queries in one Qdrant request.
+        
+        Query embeddings are generated in one batch per language, and all
+        searches are sent together through `query_batch_points`.
+        
+        Args:
+            query_texts: Query texts to search for
+            limit: Maximum number of results to return per query
+            score_threshold: Minimum similarity score threshold
+            filters: Optional metadata filters applied to every query
+            language: Language code shared by all queries if already known;
+                detected per query otherwise
+            
+        Returns:
+            One list of similar chunks per query, in input order
+        """
+        if not query_texts:
+            return []
+        
+        try:
+            # Embedding models are chosen per language, so batch within each language
+            by_language: Dict[str, List[int]] = {}
+            for i, query_text in enumerate(query_texts):
+                by_language.setdefault(language or self._detect_language(query_text), []).append(i)
+            
+            query_embeddings: List[Optional[np.ndarray]] = [None] * len(query_texts)
+            for query_language, indices in by_language.items():
+                embeddings = await self.generate_embeddings(
+                    [query_texts[i] for i in indices], query_language
+                )
+                for i, embedding in zip(indices, embeddings):
+                    query_embeddings[i] = embedding
+            
+            self.logger.info(
+                "Performing batch similarity search",
+                query_count=len(query_texts),
+                languages=list(by_language),
+                limit=limit
+            )
+            
+            search_filter = self._build_search_filter(filters)
+            batch_responses = await self.qdrant_client.query_batch_points(
+                collection_name=self.collection_name,
+                requests=[
+                    models.QueryRequest(
+                        query=embedding.tolist(),
+                        filter=search_filter,
+                        limit=limit,
+                        score_threshold=score_threshold,
+                        with_payload=True
+                    )
+                    for embedding in query_embeddings
+                ]
+            )
+            
+            return [self._format_search_results(response.points) for response in batch_responses]
+            
+        except Exception as e:
+            self.logger.error(
+                "Batch similarity search failed",
+                query_count=len(query_texts),
+                error=str(e)
+            )
+            return [[] for _ in query_texts]
+    
+    def _build_search_filter(self, filters: Optional[Dict[str, Any]]) -> Optional[models.Filter]:
+        """Build a Qdrant filter matching every metadata key/value pair."""
+        if not filters:
+            return None
+        
+        conditions = tuple(sorted(filters.items()))
+        try:
+            return _cached_search_filter(conditions)
+        except TypeError:
+            # Unhashable values cannot key the cache; build this one directly
+            return _cached_search_filter.__wrapped__(conditions)
+    
+    def _format_search_results(self, search_results: List[Any]) -> List[Dict[str, Any]]:
+        """Convert Qdrant scored points into result dicts."""
+        return [
+            {
+                "id": result.id,
+                "score": result.score,
+                "text": result.payload.get("text", ""),
+                "language": result.payload.get("language", "unknown"),
+                "metadata": {k: v for k, v in result.payload.items()
+                             if k not in ["text", "language"]}
+            }
+            for result in search_results
+        ]
+    
     async def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics."""
         try:
@@ -358,30 +778,43 @@ class VectorService(BaseService):
                     "message": "Service not initialized"
                 }
             
-            # Test Qdrant
-            collections = await self.qdrant_client.get_collections()
-            qdrant_healthy = len(collections.collections) >= 0
-            
-            # Test Ollama
-            ollama_response = await self.ollama_client.get("/api/tags", timeout=5.0)
-            ollama_healthy = ollama_response.status_code == 200
-            
-            # Get collection stats
-            stats = await self.get_collection_stats()
-            
-            overall_status = "healthy" if (qdrant_healthy and ollama_healthy) else "unhealthy"
+            # Probe Qdrant and Ollama concurrently; each failure only marks its own subsystem
+            collections, ollama_response, stats = await asyncio.gather(
+                self.qdrant_client.get_collections(),
+                self.ollama_client.get("/api/tags", timeout=5.0),
+                self.get_collection_stats(),
+                return_exceptions=True
+            )
             
-            return {
-                "status": overall_status,
-                "qdrant": {
-                    "status": "healthy" if qdrant_healthy else "unhealthy",
+            if isinstance(collections, Exception):
+                qdrant = {"status": "unhealthy", "error": str(collections)}
+            else:
+                qdrant = {
+                    "status": "healthy",
                     "collections_count": len(collections.collections),
                     "collection_stats": stats
-                },
-                "ollama": {
+                }
+            
+            if isinstance(ollama_response, Exception):
+                ollama = {
+                    "status": "unhealthy",
+                    "error": str(ollama_response),
+                    "models_available": []
+                }
+            else:
+                ollama_healthy = ollama_response.status_code == 200
+                ollama = {
                     "status": "healthy" if ollama_healthy else "unhealthy",
                     "models_available": ollama_response.json().get("models", []) if ollama_healthy else []
                 }
+            
+            all_healthy = qdrant["status"] == ollama["status"] == "healthy"
+            overall_status = "healthy" if all_healthy else "unhealthy"
+            
+            return {
+                "status": overall_status,
+                "qdrant": qdrant,
+                "ollama": ollama
             }
             
         except Exception as e:
@@ -0,0 +1,82 @@
+"""
+Out-of-band storage for large job payloads.
+Tasks pass a reference to the payload instead of the payload itself,
+so multi-megabyte documents never travel through the Celery broker or result backend.
+"""
+
+import functools
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import orjson
+import redis
+
+from ..core.config import get_settings
+
+TEXT_URI_SCHEME = 'file://'
+
+# Per-job stage results live in one Redis hash: job:{job_id} -> {stage: json}
+JOB_STATE_KEY = 'job:{job_id}'
+JOB_STATE_TTL_SECONDS = 24 * 3600
+
+
+def _job_dir(job_id: str) -> Path:
+    """Directory holding the artifacts of a single job."""
+    return Path(get_settings().output_data_dir) / 'jobs' / job_id
+
+
+def store_job_text(job_id: str, name: str, text: str) -> str:
+    """
+    Write a text artifact for a job and return its URI.
+    """
+    path = _job_dir(job_id) / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding='utf-8')
+    return f"{TEXT_URI_SCHEME}{path.resolve()}"
+
+
+def load_job_text(text_uri: str) -> str:
+    """
+    Read a text artifact previously written by `store_job_text`.
+    """
+    if not text_uri.startswith(TEXT_URI_SCHEME):
+        raise ValueError(f"Unsupported artifact URI: {text_uri}")
+    return Path(text_uri[len(TEXT_URI_SCHEME):]).read_text(encoding='utf-8')
+
+
+def delete_job_artifacts(job_id: str) -> bool:
+    """
+    Remove every artifact stored for a job. Returns whether anything was removed.
+    """
+    job_dir = _job_dir(job_id)
+    if not job_dir.exists():
+        return False
+    shutil.rmtree(job_dir)
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _redis_client() -> redis.Redis:
+    """Per-process Redis client for job state."""
+    settings = get_settings()
+    return redis.Redis.from_url(settings.redis_url, max_connections=settings.redis_max_connections)
+
+
+def save_job_state(job_id: str, stage: str, result: Dict[str, Any]) -> None:
+    """
+    Record the result of a pipeline stage under the job's state hash.
+    """
+    key = JOB_STATE_KEY.format(job_id=job_id)
+    pipe = _redis_client().pipeline(transaction=False)
+    pipe.hset(key, stage, orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+    pipe.expire(key, JOB_STATE_TTL_SECONDS)
+    pipe.execute()
+
+
+def load_job_state(job_id: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch every recorded stage result for a job in a single round trip.
+    """
+    raw = _redis_client().hgetall(JOB_STATE_KEY.format(job_id=job_id))
+    return {stage.decode(): orjson.loads(value) for stage, value in raw.items()}
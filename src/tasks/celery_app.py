@@ -3,8 +3,22 @@ Celery application configuration for background task processing.
 """
 
 import os
+from functools import partial
+
+import orjson
 from celery import Celery
 from kombu import Queue
+from kombu.serialization import register
+
+# orjson-backed serializer: C-speed encode/decode of the large result dicts
+# passed between pipeline tasks; NumPy arrays are serialized natively
+register(
+    'orjson',
+    partial(orjson.dumps, option=orjson.OPT_SERIALIZE_NUMPY),
+    orjson.loads,
+    content_type='application/x-orjson',
+    content_encoding='binary',
+)
 
 # Get Redis URL from environment
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
@@ -32,10 +46,11 @@ celery_app.conf.update(
         'src.tasks.monitoring_tasks.*': {'queue': 'monitoring'},
     },
     
-    # Task serialization
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # Task serialization (json still accepted for messages queued by older clients)
+    task_serializer='orjson',
+    accept_content=['orjson', 'json'],
+    result_serializer='orjson',
+    result_accept_content=['orjson', 'json'],
     
     # Task results
     result_expires=3600,  # 1 hour
@@ -84,12 +99,31 @@ celery_app.conf.task_annotations = {
         'rate_limit': '3/m',  # Max 3 OCR tasks per minute
         'time_limit': 600,    # 10 minute timeout
         'soft_time_limit': 540,  # 9 minute soft timeout
+        'acks_late': True,    # Long CPU-bound job: survive worker crashes
     },
     'src.tasks.generation_tasks.generate_learning_objectives': {
         'rate_limit': '10/m',  # Max 10 generation tasks per minute
         'time_limit': 300,     # 5 minute timeout
     },
+    # Short, idempotent I/O tasks on the monitoring queue: ack on receipt
+    # so a light worker with a deeper prefetch never re-runs them
+    'src.tasks.monitoring_tasks.health_check_services': {
+        'acks_late': False,
+        'time_limit': 30,
+    },
+    'src.tasks.monitoring_tasks.update_system_metrics': {
+        'acks_late': False,
+        'time_limit': 60,
+    },
+    'src.tasks.monitoring_tasks.cleanup_expired_jobs': {
+        'acks_late': False,
+    },
 }
 
+# Worker profiles (see docker-compose.yml). Heavy and light queues are served by
+# separate workers so minutes-long OCR jobs never block health checks:
+#   heavy: -Q default,ocr,processing,generation --prefetch-multiplier=1
+#   light: -Q monitoring --pool=threads --concurrency=8 --prefetch-multiplier=4
+
 if __name__ == '__main__':
     celery_app.start()
\ No newline at end of file
@@ -3,12 +3,13 @@ Learning objectives generation tasks.
 Handles LO generation, refinement, and quality assessment.
 """
 
-import asyncio
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from celery import current_task
 
 from .celery_app import celery_app
+from .runtime import run_async
+from .progress import ProgressReporter
 from ..services.generation_service import GenerationService
 from ..services.llm_service import LLMService
 from ..services.vector_service import VectorService
@@ -17,12 +18,20 @@ from ..core.logging import get_logger
 logger = get_logger(__name__)
 
 @celery_app.task(bind=True, name='src.tasks.generation_tasks.generate_learning_objectives')
-def generate_learning_objectives(self, job_id: str, chunk_ids: List[str], 
-                                generation_config: Dict[str, Any]) -> Dict[str, Any]:
+def generate_learning_objectives(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                                job_id: str, generation_config: Dict[str, Any],
+                                chunk_ids: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Generate learning objectives from processed chunks.
+    
+    Inside a chain the chunk ids come from the previous stage's result.
     """
     try:
+        if chunk_ids is None:
+            chunk_ids = (previous_result or {}).get('chunk_ids')
+        if chunk_ids is None:
+            raise ValueError("chunk_ids must be provided or passed on by the previous stage")
+        
         logger.info(f"Starting LO generation for job {job_id}: {len(chunk_ids)} chunks")
         
         current_task.update_state(
@@ -30,6 +39,8 @@ def generate_learning_objectives(self, job_id: str, chunk_ids: List[str],
             meta={'stage': 'initializing_generation', 'progress': 85}
         )
         
+        generation_progress = ProgressReporter('generating_objectives')
+        
         async def _generate():
             generation_service = GenerationService()
             
@@ -37,10 +48,7 @@ def generate_learning_objectives(self, job_id: str, chunk_ids: List[str],
             los = await generation_service.generate_learning_objectives(
                 chunk_ids=chunk_ids,
                 config=generation_config,
-                progress_callback=lambda progress: current_task.update_state(
-                    state='PROGRESS',
-                    meta={'stage': 'generating_objectives', 'progress': 85 + (progress * 0.1)}
-                )
+                progress_callback=lambda progress: generation_progress.report(85 + (progress * 0.1))
             )
             
             current_task.update_state(
@@ -53,10 +61,7 @@ def generate_learning_objectives(self, job_id: str, chunk_ids: List[str],
             
             return los, quality_assessment
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        learning_objectives, quality_assessment = loop.run_until_complete(_generate())
-        loop.close()
+        learning_objectives, quality_assessment = run_async(_generate())
         
         logger.info(f"LO generation completed for job {job_id}: {len(learning_objectives)} objectives generated")
         
@@ -108,6 +113,8 @@ def refine_learning_objectives(self, job_id: str, original_los: List[Dict[str, A
             meta={'stage': 'analyzing_objectives', 'progress': 10}
         )
         
+        refinement_progress = ProgressReporter('refining_objectives')
+        
         async def _refine():
             generation_service = GenerationService()
             
@@ -136,10 +143,7 @@ def refine_learning_objectives(self, job_id: str, original_los: List[Dict[str, A
             refined_los = await generation_service.refine_learning_objectives(
                 original_los=lo_objects,
                 refinement_criteria=refinement_config,
-                progress_callback=lambda progress: current_task.update_state(
-                    state='PROGRESS',
-                    meta={'stage': 'refining_objectives', 'progress': 30 + (progress * 0.6)}
-                )
+                progress_callback=lambda progress: refinement_progress.report(30 + (progress * 0.6))
             )
             
             current_task.update_state(
@@ -152,10 +156,7 @@ def refine_learning_objectives(self, job_id: str, original_los: List[Dict[str, A
             
             return refined_los, quality_assessment
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        refined_objectives, quality_assessment = loop.run_until_complete(_refine())
-        loop.close()
+        refined_objectives, quality_assessment = run_async(_refine())
         
         logger.info(f"LO refinement completed for job {job_id}: {len(refined_objectives)} refined objectives")
         
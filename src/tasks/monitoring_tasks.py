@@ -3,12 +3,12 @@ Monitoring and maintenance tasks.
 Handles job cleanup, metrics collection, and system health monitoring.
 """
 
-import asyncio
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
 from celery import current_task
 
 from .celery_app import celery_app
+from .runtime import run_async
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,23 +23,18 @@ def cleanup_expired_jobs(retention_days: int = 7) -> Dict[str, Any]:
         
         cutoff_date = datetime.utcnow() - timedelta(days=retention_days)
         
-        async def _cleanup():
-            # This would typically involve:
-            # 1. Query database for expired jobs
-            # 2. Remove job results and metadata
-            # 3. Clean up temporary files
-            # 4. Update metrics
-            
-            # Mock cleanup for now
-            expired_jobs = []  # Would query from database
-            cleaned_files = []
-            
-            return len(expired_jobs), len(cleaned_files)
+        # This would typically involve:
+        # 1. Query database for expired jobs
+        # 2. Remove job results and metadata
+        # 3. Clean up temporary files
+        # 4. Update metrics
+        # (run through run_async once any of these steps needs async I/O)
+        
+        # Mock cleanup for now
+        expired_jobs = []  # Would query from database
+        cleaned_files = []
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        expired_count, files_cleaned = loop.run_until_complete(_cleanup())
-        loop.close()
+        expired_count, files_cleaned = len(expired_jobs), len(cleaned_files)
         
         cleanup_result = {
             'cleanup_completed': True,
@@ -68,37 +63,29 @@ def update_system_metrics() -> Dict[str, Any]:
     try:
         logger.info("Updating system metrics")
         
-        async def _collect_metrics():
-            # This would collect various system metrics:
-            # - Queue lengths
-            # - Processing times
-            # - Resource usage
-            # - Success/failure rates
-            
-            metrics = {
-                'queue_metrics': {
-                    'ocr_queue_length': 0,  # Would query Redis
-                    'processing_queue_length': 0,
-                    'generation_queue_length': 0
-                },
-                'processing_metrics': {
-                    'average_ocr_time': 45.2,  # Would calculate from recent jobs
-                    'average_generation_time': 12.3,
-                    'success_rate_24h': 0.96
-                },
-                'resource_metrics': {
-                    'cpu_usage': 0.45,  # Would get from system
-                    'memory_usage': 0.67,
-                    'disk_usage': 0.23
-                }
+        # This would collect various system metrics:
+        # - Queue lengths
+        # - Processing times
+        # - Resource usage
+        # - Success/failure rates
+        
+        metrics = {
+            'queue_metrics': {
+                'ocr_queue_length': 0,  # Would query Redis
+                'processing_queue_length': 0,
+                'generation_queue_length': 0
+            },
+            'processing_metrics': {
+                'average_ocr_time': 45.2,  # Would calculate from recent jobs
+                'average_generation_time': 12.3,
+                'success_rate_24h': 0.96
+            },
+            'resource_metrics': {
+                'cpu_usage': 0.45,  # Would get from system
+                'memory_usage': 0.67,
+                'disk_usage': 0.23
             }
-            
-            return metrics
-        
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        metrics = loop.run_until_complete(_collect_metrics())
-        loop.close()
+        }
         
         # Store metrics (would typically write to monitoring system)
         result = {
@@ -129,19 +116,22 @@ def health_check_services() -> Dict[str, Any]:
             # Check various service dependencies
             service_status = {}
             
+            # One timestamp for the whole sweep; the checks run back to back
+            now = datetime.utcnow().isoformat()
+            
             # Database health
             try:
                 # Would perform actual database connection test
                 service_status['database'] = {
                     'status': 'healthy',
                     'response_time_ms': 15,
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             except Exception as e:
                 service_status['database'] = {
                     'status': 'unhealthy',
                     'error': str(e),
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             
             # Redis health
@@ -150,13 +140,13 @@ def health_check_services() -> Dict[str, Any]:
                 service_status['redis'] = {
                     'status': 'healthy',
                     'response_time_ms': 3,
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             except Exception as e:
                 service_status['redis'] = {
                     'status': 'unhealthy',
                     'error': str(e),
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             
             # Vector database health
@@ -165,13 +155,13 @@ def health_check_services() -> Dict[str, Any]:
                 service_status['qdrant'] = {
                     'status': 'healthy',
                     'response_time_ms': 25,
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             except Exception as e:
                 service_status['qdrant'] = {
                     'status': 'unhealthy',
                     'error': str(e),
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             
             # LLM service health
@@ -180,21 +170,18 @@ def health_check_services() -> Dict[str, Any]:
                 service_status['llm_service'] = {
                     'status': 'healthy',
                     'response_time_ms': 150,
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             except Exception as e:
                 service_status['llm_service'] = {
                     'status': 'unhealthy',
                     'error': str(e),
-                    'last_check': datetime.utcnow().isoformat()
+                    'last_check': now
                 }
             
             return service_status
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        service_status = loop.run_until_complete(_check_services())
-        loop.close()
+        service_status = run_async(_check_services())
         
         # Determine overall system health
         unhealthy_services = [
@@ -4,24 +4,53 @@ Handles PDF upload, OCR processing, and text extraction.
 """
 
 import os
-import asyncio
-from typing import Dict, Any, List
+import functools
+from typing import Dict, Any, List, Optional
 from datetime import datetime
 from celery import current_task
+from celery.signals import worker_process_init
 from pathlib import Path
 
 from .celery_app import celery_app
+from .runtime import run_async
+from .artifacts import store_job_text, delete_job_artifacts
+from .progress import ProgressReporter
 from ..services.ocr_service import OCRService
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _ocr_service() -> OCRService:
+    """Return the per-process OCR service, built once and reused across tasks."""
+    return OCRService()
+
+
+@worker_process_init.connect
+def _warm_ocr_service(**kwargs) -> None:
+    """Build the OCR service when a worker process starts, not on its first task."""
+    _ocr_service()
+
+
 @celery_app.task(bind=True, name='src.tasks.ocr_tasks.process_pdf_ocr')
-def process_pdf_ocr(self, job_id: str, pdf_path: str, ocr_config: Dict[str, Any]) -> Dict[str, Any]:
+def process_pdf_ocr(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                    job_id: str, ocr_config: Dict[str, Any],
+                    pdf_path: Optional[str] = None) -> Dict[str, Any]:
     """
     Process PDF document through OCR pipeline.
+    
+    Inside a chain the previous result is the `validate_uploaded_pdf` report:
+    an invalid upload stops the chain here, a valid one supplies the path.
     """
     try:
+        validation = previous_result or {}
+        if not validation.get('valid', True):
+            raise ValueError(f"PDF validation failed: {validation.get('error', 'unknown error')}")
+        pdf_path = pdf_path or validation.get('file_path')
+        if not pdf_path:
+            raise ValueError("pdf_path must be provided or passed on by the previous stage")
+        
         logger.info(f"Starting OCR processing for job {job_id}: {pdf_path}")
         
         current_task.update_state(
@@ -33,8 +62,11 @@ def process_pdf_ocr(self, job_id: str, pdf_path: str, ocr_config: Dict[str, Any]
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         
+        # Per-page callbacks are coalesced into few result-backend writes
+        ocr_progress = ProgressReporter('processing_ocr')
+        
         async def _process_ocr():
-            ocr_service = OCRService()
+            ocr_service = _ocr_service()
             
             # Update progress
             current_task.update_state(
@@ -48,18 +80,12 @@ def process_pdf_ocr(self, job_id: str, pdf_path: str, ocr_config: Dict[str, Any]
                 job_id=job_id,
                 languages=ocr_config.get('languages', ['eng', 'tha']),
                 max_concurrent_pages=ocr_config.get('max_concurrent_pages', 3),
-                progress_callback=lambda progress: current_task.update_state(
-                    state='PROGRESS',
-                    meta={'stage': 'processing_ocr', 'progress': 10 + (progress * 0.7)}
-                )
+                progress_callback=lambda progress: ocr_progress.report(10 + (progress * 0.7))
             )
             
             return result
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        ocr_result = loop.run_until_complete(_process_ocr())
-        loop.close()
+        ocr_result = run_async(_process_ocr())
         
         current_task.update_state(
             state='PROGRESS',
@@ -68,10 +94,13 @@ def process_pdf_ocr(self, job_id: str, pdf_path: str, ocr_config: Dict[str, Any]
         
         logger.info(f"OCR processing completed for job {job_id}: {ocr_result.total_pages} pages processed")
         
+        # Keep the document body out of the result backend; downstream tasks load it by URI
+        text_uri = store_job_text(job_id, 'ocr.txt', ocr_result.extracted_text)
+        
         return {
             'job_id': job_id,
             'pdf_path': pdf_path,
-            'extracted_text': ocr_result.extracted_text,
+            'text_uri': text_uri,
             'processing_summary': {
                 'total_pages': ocr_result.total_pages,
                 'pages_processed': ocr_result.pages_processed,
@@ -121,7 +150,7 @@ def validate_uploaded_pdf(self, file_path: str, max_size_mb: int = 50,
         
         # Quick PDF validation using OCR service
         async def _validate():
-            ocr_service = OCRService()
+            ocr_service = _ocr_service()
             page_count = await ocr_service.get_pdf_page_count(file_path)
             
             if page_count > max_pages:
@@ -129,10 +158,7 @@ def validate_uploaded_pdf(self, file_path: str, max_size_mb: int = 50,
                 
             return page_count
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        page_count = loop.run_until_complete(_validate())
-        loop.close()
+        page_count = run_async(_validate())
         
         validation_result = {
             'file_path': file_path,
@@ -155,35 +181,51 @@ def validate_uploaded_pdf(self, file_path: str, max_size_mb: int = 50,
         }
 
 @celery_app.task(bind=True, name='src.tasks.ocr_tasks.cleanup_processed_files')
-def cleanup_processed_files(self, job_id: str, file_paths: List[str], 
+def cleanup_processed_files(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                           job_id: str, file_paths: Optional[List[str]] = None,
                            keep_original: bool = True) -> Dict[str, Any]:
     """
     Clean up temporary files created during OCR processing.
+    
+    Runs as the last link of the PDF chain; the generation result it receives
+    is not needed. The job's artifact directory (OCR text) is always removed.
     """
     try:
+        file_paths = file_paths or []
+        
         logger.info(f"Cleaning up processed files for job {job_id}")
         
         cleaned_files = []
         errors = []
         
-        for file_path in file_paths:
+        # Partition once up front: skip original PDFs if keep_original is True
+        targets = [p for p in file_paths if not p.endswith('.pdf')] if keep_original else file_paths
+        
+        for file_path in targets:
             try:
-                # Skip original PDF if keep_original is True
-                if keep_original and file_path.endswith('.pdf'):
-                    continue
-                
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    cleaned_files.append(file_path)
-                    logger.debug(f"Removed file: {file_path}")
+                # Single unlink syscall per file; a missing file is not an error
+                os.remove(file_path)
+                cleaned_files.append(file_path)
+                logger.debug(f"Removed file: {file_path}")
+            
+            except FileNotFoundError:
+                continue
             
             except Exception as e:
                 errors.append(f"Failed to remove {file_path}: {str(e)}")
                 logger.error(f"File cleanup error: {str(e)}")
         
+        try:
+            artifacts_removed = delete_job_artifacts(job_id)
+        except OSError as e:
+            artifacts_removed = False
+            errors.append(f"Failed to remove artifacts of job {job_id}: {str(e)}")
+            logger.error(f"Artifact cleanup error: {str(e)}")
+        
         return {
             'job_id': job_id,
             'cleaned_files': cleaned_files,
+            'artifacts_removed': artifacts_removed,
             'errors': errors,
             'cleanup_completed': len(errors) == 0
         }
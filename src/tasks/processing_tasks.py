@@ -4,13 +4,18 @@ Handles document analysis, chunking, and embedding generation.
 """
 
 import json
-import asyncio
+import functools
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
+import numpy as np
 from celery import current_task
+from celery.signals import worker_process_init
 from celery.exceptions import Retry
 
 from .celery_app import celery_app
+from .runtime import run_async
+from .artifacts import load_job_text, save_job_state, load_job_state
+from .progress import ProgressReporter
 from ..services.document_analyzer import DocumentAnalyzer, ProcessingPath
 from ..services.chunking_service import ChunkingService
 from ..services.vector_service import VectorService
@@ -20,12 +25,44 @@ from ..database.connection import get_async_session
 
 logger = get_logger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _document_analyzer() -> DocumentAnalyzer:
+    """Return the per-process document analyzer."""
+    return DocumentAnalyzer()
+
+
+@functools.lru_cache(maxsize=1)
+def _chunking_service() -> ChunkingService:
+    """Return the per-process chunking service (owns the OCR service and LLM agent)."""
+    return ChunkingService()
+
+
+@worker_process_init.connect
+def _warm_processing_services(**kwargs) -> None:
+    """Build the stateless processing services when a worker process starts."""
+    _document_analyzer()
+    _chunking_service()
+
+
 @celery_app.task(bind=True, name='src.tasks.processing_tasks.analyze_document')
-def analyze_document(self, job_id: str, file_path: str, content_type: str) -> Dict[str, Any]:
+def analyze_document(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                     job_id: str, content_type: str, file_path: Optional[str] = None,
+                     persist_state: bool = False) -> Dict[str, Any]:
     """
     Analyze document to determine optimal processing path.
+    
+    Inside a chain the document path may come from the previous stage
+    (`pdf_path` of the OCR result), whose `text_uri` is passed on to chunking.
+    The full analysis is recorded in the job's Redis state only when
+    `persist_state` is set, i.e. when `complete_processing_pipeline` reads it back.
     """
     try:
+        previous_result = previous_result or {}
+        file_path = file_path or previous_result.get('pdf_path')
+        if not file_path:
+            raise ValueError("file_path must be provided or passed on by the previous stage")
+        
         logger.info(f"Starting document analysis for job {job_id}")
         
         # Update job status
@@ -36,25 +73,29 @@ def analyze_document(self, job_id: str, file_path: str, content_type: str) -> Di
         
         # Run analysis
         async def _analyze():
-            analyzer = DocumentAnalyzer()
+            analyzer = _document_analyzer()
             result = await analyzer.analyze_document(file_path, content_type)
             return result
         
         # Run async analysis in sync context
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        analysis_result = loop.run_until_complete(_analyze())
-        loop.close()
+        analysis_result = run_async(_analyze())
         
         logger.info(f"Document analysis completed for job {job_id}: {analysis_result.processing_path}")
         
+        if persist_state:
+            save_job_state(job_id, 'analysis', {
+                'job_id': job_id,
+                'processing_path': analysis_result.processing_path.value,
+                'document_metadata': analysis_result.metadata,
+                'quality_score': analysis_result.quality_score,
+                'estimated_processing_time': analysis_result.estimated_processing_time,
+                'recommendations': analysis_result.recommendations
+            })
+        
         return {
             'job_id': job_id,
             'processing_path': analysis_result.processing_path.value,
-            'document_metadata': analysis_result.metadata,
-            'quality_score': analysis_result.quality_score,
-            'estimated_processing_time': analysis_result.estimated_processing_time,
-            'recommendations': analysis_result.recommendations
+            'text_uri': previous_result.get('text_uri')
         }
         
     except Exception as e:
@@ -66,12 +107,29 @@ def analyze_document(self, job_id: str, file_path: str, content_type: str) -> Di
         raise
 
 @celery_app.task(bind=True, name='src.tasks.processing_tasks.process_content_chunks')
-def process_content_chunks(self, job_id: str, content: str, processing_path: str, 
-                          chunk_config: Dict[str, Any]) -> Dict[str, Any]:
+def process_content_chunks(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                          job_id: str, content: Optional[str] = None,
+                          processing_path: Optional[str] = None,
+                          chunk_config: Optional[Dict[str, Any]] = None,
+                          text_uri: Optional[str] = None,
+                          persist_state: bool = False) -> Dict[str, Any]:
     """
     Process content into chunks using specified chunking strategy.
+    
+    Content is passed inline for direct text jobs, or by `text_uri` for
+    large documents stored out-of-band (e.g. OCR output). Inside a chain the
+    processing path and text URI are taken from the analysis result when not
+    given. Only the chunk ids are returned; the chunk statistics are recorded
+    when `persist_state` is set.
     """
     try:
+        previous_result = previous_result or {}
+        processing_path = processing_path or previous_result.get('processing_path')
+        text_uri = text_uri or previous_result.get('text_uri')
+        if not processing_path:
+            raise ValueError("processing_path must be provided or passed on by the previous stage")
+        chunk_config = chunk_config or {}
+        
         logger.info(f"Starting content chunking for job {job_id} with path: {processing_path}")
         
         current_task.update_state(
@@ -79,8 +137,13 @@ def process_content_chunks(self, job_id: str, content: str, processing_path: str
             meta={'stage': 'chunking_content', 'progress': 30}
         )
         
+        if content is None:
+            if text_uri is None:
+                raise ValueError("Either content or text_uri must be provided")
+            content = load_job_text(text_uri)
+        
         async def _chunk():
-            chunking_service = ChunkingService()
+            chunking_service = _chunking_service()
             
             if processing_path == 'structural':
                 chunks = await chunking_service.structural_chunk(content, chunk_config)
@@ -92,10 +155,7 @@ def process_content_chunks(self, job_id: str, content: str, processing_path: str
             
             return chunks
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        chunks = loop.run_until_complete(_chunk())
-        loop.close()
+        chunks = run_async(_chunk())
         
         logger.info(f"Content chunking completed for job {job_id}: {len(chunks)} chunks created")
         
@@ -104,16 +164,28 @@ def process_content_chunks(self, job_id: str, content: str, processing_path: str
         for chunk in chunks:
             chunk_ids.append(chunk.chunk_id)
         
-        return {
-            'job_id': job_id,
-            'chunk_ids': chunk_ids,
-            'total_chunks': len(chunks),
-            'processing_summary': {
-                'processing_path': processing_path,
-                'average_chunk_size': sum(len(chunk.content) for chunk in chunks) / len(chunks),
-                'total_tokens_estimated': sum(chunk.metadata.get('token_count', 0) for chunk in chunks)
-            }
-        }
+        if persist_state:
+            # Aggregate chunk statistics in C rather than with Python generators
+            chunk_sizes = np.fromiter(
+                (len(chunk.content) for chunk in chunks), dtype=np.int64, count=len(chunks)
+            )
+            token_counts = np.fromiter(
+                (chunk.metadata.get('token_count', 0) for chunk in chunks),
+                dtype=np.int64, count=len(chunks)
+            )
+            
+            save_job_state(job_id, 'chunks', {
+                'job_id': job_id,
+                'chunk_ids': chunk_ids,
+                'total_chunks': len(chunks),
+                'processing_summary': {
+                    'processing_path': processing_path,
+                    'average_chunk_size': float(chunk_sizes.mean()),
+                    'total_tokens_estimated': int(token_counts.sum())
+                }
+            })
+        
+        return {'job_id': job_id, 'chunk_ids': chunk_ids}
         
     except Exception as e:
         logger.error(f"Content chunking failed for job {job_id}: {str(e)}")
@@ -124,11 +196,22 @@ def process_content_chunks(self, job_id: str, content: str, processing_path: str
         raise
 
 @celery_app.task(bind=True, name='src.tasks.processing_tasks.generate_embeddings')
-def generate_embeddings(self, job_id: str, chunk_ids: List[str]) -> Dict[str, Any]:
+def generate_embeddings(self, previous_result: Optional[Dict[str, Any]] = None, *,
+                        job_id: str, chunk_ids: Optional[List[str]] = None,
+                        persist_state: bool = False) -> Dict[str, Any]:
     """
     Generate vector embeddings for processed chunks.
+    
+    Inside a chain the chunk ids come from the chunking result. Returns the
+    chunk ids for the next stage; the embedding summary is recorded in the
+    job's Redis state when `persist_state` is set.
     """
     try:
+        if chunk_ids is None:
+            chunk_ids = (previous_result or {}).get('chunk_ids')
+        if chunk_ids is None:
+            raise ValueError("chunk_ids must be provided or passed on by the previous stage")
+        
         logger.info(f"Starting embedding generation for job {job_id}: {len(chunk_ids)} chunks")
         
         current_task.update_state(
@@ -142,40 +225,42 @@ def generate_embeddings(self, job_id: str, chunk_ids: List[str]) -> Dict[str, An
             # Process chunks in batches
             batch_size = 10
             processed_chunks = 0
+            total_chunks = len(chunk_ids)
+            progress_step = 20.0 / total_chunks if total_chunks else 0.0  # 60-80% progress
+            progress = ProgressReporter('generating_embeddings')
             
-            for i in range(0, len(chunk_ids), batch_size):
+            for i in range(0, total_chunks, batch_size):
                 batch_chunk_ids = chunk_ids[i:i + batch_size]
                 
                 # Generate embeddings for batch
                 await vector_service.generate_chunk_embeddings(batch_chunk_ids)
                 
                 processed_chunks += len(batch_chunk_ids)
-                progress = 60 + (processed_chunks / len(chunk_ids)) * 20  # 60-80% progress
                 
-                current_task.update_state(
-                    state='PROGRESS',
-                    meta={'stage': 'generating_embeddings', 'progress': progress}
+                progress.report(
+                    60 + processed_chunks * progress_step,
+                    force=processed_chunks == total_chunks
                 )
             
             return processed_chunks
         
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        processed_count = loop.run_until_complete(_generate_embeddings())
-        loop.close()
+        processed_count = run_async(_generate_embeddings())
         
         logger.info(f"Embedding generation completed for job {job_id}: {processed_count} embeddings created")
         
-        return {
-            'job_id': job_id,
-            'embeddings_generated': processed_count,
-            'vector_store_updated': True,
-            'processing_summary': {
-                'total_chunks_processed': processed_count,
-                'embedding_model': 'sentence-transformers/all-MiniLM-L6-v2',
-                'vector_dimension': 384
-            }
-        }
+        if persist_state:
+            save_job_state(job_id, 'embeddings', {
+                'job_id': job_id,
+                'embeddings_generated': processed_count,
+                'vector_store_updated': True,
+                'processing_summary': {
+                    'total_chunks_processed': processed_count,
+                    'embedding_model': 'sentence-transformers/all-MiniLM-L6-v2',
+                    'vector_dimension': 384
+                }
+            })
+        
+        return {'job_id': job_id, 'chunk_ids': chunk_ids}
         
     except Exception as e:
         logger.error(f"Embedding generation failed for job {job_id}: {str(e)}")
@@ -186,12 +271,21 @@ def generate_embeddings(self, job_id: str, chunk_ids: List[str]) -> Dict[str, An
         raise
 
 @celery_app.task(bind=True, name='src.tasks.processing_tasks.complete_processing_pipeline')
-def complete_processing_pipeline(self, job_id: str, analysis_result: Dict[str, Any], 
-                                chunks_result: Dict[str, Any], embeddings_result: Dict[str, Any]) -> Dict[str, Any]:
+def complete_processing_pipeline(self, previous_result: Optional[Dict[str, Any]] = None,
+                                job_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Complete the content processing pipeline and prepare for LO generation.
+    
+    Runs as the last link of `chain(analyze, chunk, embed, complete)`: stage
+    results are read back from the job's Redis state in one round trip rather
+    than being shipped through the broker as task arguments. The chunk ids are
+    passed on for the generation stage.
     """
     try:
+        job_id = job_id or (previous_result or {}).get('job_id')
+        if not job_id:
+            raise ValueError("job_id is required to complete the processing pipeline")
+        
         logger.info(f"Completing processing pipeline for job {job_id}")
         
         current_task.update_state(
@@ -199,11 +293,21 @@ def complete_processing_pipeline(self, job_id: str, analysis_result: Dict[str, A
             meta={'stage': 'finalizing_processing', 'progress': 80}
         )
         
+        job_state = load_job_state(job_id)
+        missing_stages = {'analysis', 'chunks', 'embeddings'} - job_state.keys()
+        if missing_stages:
+            raise ValueError(f"Missing pipeline stages for job {job_id}: {sorted(missing_stages)}")
+        
+        analysis_result = job_state['analysis']
+        chunks_result = job_state['chunks']
+        embeddings_result = job_state['embeddings']
+        
         # Combine results
         processing_complete = {
             'job_id': job_id,
             'processing_path': analysis_result['processing_path'],
             'document_metadata': analysis_result['document_metadata'],
+            'chunk_ids': chunks_result['chunk_ids'],
             'chunks_created': chunks_result['total_chunks'],
             'embeddings_generated': embeddings_result['embeddings_generated'],
             'ready_for_generation': True,
@@ -0,0 +1,49 @@
+"""
+Throttled progress reporting for Celery tasks.
+Coalesces fine-grained progress callbacks into few result-backend writes.
+"""
+
+import time
+from typing import Optional
+
+from celery import current_task
+
+
+class ProgressReporter:
+    """
+    Push PROGRESS state for the current task, dropping updates that would not
+    be visible to pollers anyway.
+
+    An update is flushed when the stage changes, when progress has moved by at
+    least `min_delta` points, or when `min_interval` seconds have passed since
+    the last write.
+    """
+
+    def __init__(self, stage: str, min_delta: float = 1.0, min_interval: float = 0.5):
+        self.stage = stage
+        self.min_delta = min_delta
+        self.min_interval = min_interval
+        self._last_stage: Optional[str] = None
+        self._last_progress = float('-inf')
+        self._last_time = float('-inf')
+
+    def report(self, progress: float, stage: Optional[str] = None, force: bool = False) -> None:
+        """Record progress, writing to the result backend only when warranted."""
+        stage = stage or self.stage
+        now = time.monotonic()
+
+        if not (
+            force
+            or stage != self._last_stage
+            or progress - self._last_progress >= self.min_delta
+            or now - self._last_time >= self.min_interval
+        ):
+            return
+
+        self._last_stage = stage
+        self._last_progress = progress
+        self._last_time = now
+        current_task.update_state(
+            state='PROGRESS',
+            meta={'stage': stage, 'progress': progress}
+        )
@@ -0,0 +1,28 @@
+"""
+Event loop management for running async service code inside Celery tasks.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar('T')
+
+# One long-lived loop per worker thread (prefork processes have a single thread,
+# the threads pool gets one loop per thread so loops are never shared)
+_thread_state = threading.local()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the calling thread's persistent event loop.
+    
+    Reusing the loop avoids creating and tearing down a loop on every task
+    invocation, and lets loop-bound clients outlive a single task.
+    """
+    loop = getattr(_thread_state, 'loop', None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+    asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
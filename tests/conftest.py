@@ -3,10 +3,18 @@ Pytest configuration and shared fixtures for all tests.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
-from typing import Dict, Any, Generator
+import functools
+from pytest_asyncio import is_async_test
+from datetime import datetime
+from types import MappingProxyType
+from typing import AsyncGenerator, Callable, Dict, Any, Generator, Mapping, Tuple
 from unittest.mock import MagicMock, AsyncMock
+from qdrant_client import AsyncQdrantClient
+import re
 import tempfile
+import time
 from pathlib import Path
 
 from src.core.config import Settings
@@ -17,22 +25,22 @@ from src.services import (
     GenerationService,
     HealthService
 )
+from tests.fakes import FakeLLMService, FakeVectorService, FakeProcessingService, FakeGenerationService
+from tests.fakes import llm as fake_llm
+from tests.fakes import vector as fake_vector
+from tests.fakes import processing as fake_processing
+from tests.fakes import generation as fake_generation
+from tests.fakes import ollama as fake_ollama
+from tests.fixtures.factories import ChunkFactory, ObjectiveFactory
+from tests.fixtures.test_data import FIXED_NOW
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
-def test_settings() -> Settings:
-    """Create test settings with safe defaults."""
+def _session_settings() -> Settings:
+    """Validate the test settings once per session."""
     return Settings(
         SECRET_KEY="test-secret-key-for-testing-only-32chars",
-        ENVIRONMENT="test",
+        ENVIRONMENT="development",
         DEBUG=True,
         DATABASE_URL="sqlite+aiosqlite:///:memory:",
         REDIS_URL="redis://localhost:6379/15",  # Use different DB for tests
@@ -45,165 +53,168 @@ def test_settings() -> Settings:
 
 
 @pytest.fixture
-def temp_directory() -> Generator[Path, None, None]:
+def test_settings(_session_settings: Settings) -> Settings:
+    """Create test settings with safe defaults."""
+    # A shallow copy skips re-validation and keeps per-test mutations isolated
+    return _session_settings.model_copy()
+
+
+@pytest.fixture(scope="session")
+def _tmp_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Session-wide root for per-test temporary directories."""
+    return tmp_path_factory.mktemp("suite")
+
+
+@pytest.fixture
+def temp_directory(_tmp_root: Path, request: pytest.FixtureRequest) -> Path:
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
+    # A cheap mkdir under the session root; pytest prunes old roots itself
+    prefix = re.sub(r"\W", "_", request.node.name)[:30]
+    return Path(tempfile.mkdtemp(prefix=f"{prefix}-", dir=_tmp_root))
+
+
+def _configure_llm(mock: AsyncMock) -> None:
+    """Apply the canned return values of the mock LLM service."""
+    mock.is_initialized.return_value = True
+    mock.generate_content.return_value = fake_llm.GENERATED_CONTENT
+    mock.generate_learning_objectives.return_value = fake_llm.LEARNING_OBJECTIVES_RAW
+    mock.validate_learning_objective.return_value = fake_llm.VALIDATION_RESULT
+    mock.health_check.return_value = fake_llm.HEALTH
+
+
+def _configure_vector(mock: AsyncMock) -> None:
+    """Apply the canned return values of the mock vector service."""
+    mock.is_initialized.return_value = True
+    mock.generate_embedding.return_value = fake_vector.mock_embedding()
+    mock.index_chunk.return_value = True
+    mock.search_similar.return_value = fake_vector.SEARCH_RESULTS
+    mock.get_collection_stats.return_value = fake_vector.COLLECTION_STATS
+    mock.health_check.return_value = fake_vector.HEALTH
+
+
+def _configure_processing(mock: AsyncMock) -> None:
+    """Apply the canned return values of the mock processing service."""
+    mock.is_initialized.return_value = True
+    mock.extract_text_from_pdf.return_value = fake_processing.EXTRACTED_TEXT
+    mock.create_chunks.return_value = fake_processing.CHUNKS
+    mock.process_pdf_file.return_value = fake_processing.PROCESSED_PDF
+    mock.health_check.return_value = fake_processing.HEALTH
+
+
+def _configure_generation(mock: AsyncMock) -> None:
+    """Apply the canned return values of the mock generation service."""
+    mock.is_initialized.return_value = True
+    mock.retrieve_context.return_value = fake_generation.CONTEXT
+    mock.generate_learning_objectives.return_value = fake_generation.GENERATION_RESULT
+    mock.health_check.return_value = fake_generation.HEALTH
+
+
+# Service class and canned-return configurator for each mock service
+_MOCK_SPECS: Dict[str, Tuple[type, Callable[[AsyncMock], None]]] = {
+    "llm": (LLMService, _configure_llm),
+    "vector": (VectorService, _configure_vector),
+    "processing": (ProcessingService, _configure_processing),
+    "generation": (GenerationService, _configure_generation),
+}
+
+
+@pytest.fixture(scope="session")
+def _mock_registry() -> Callable[[str], AsyncMock]:
+    """
+    Return a getter for service mocks.
+    
+    Each AsyncMock(spec=...) is built once per session (spec introspection is
+    the expensive part); every lookup resets it and re-applies its canned returns.
+    """
+    mocks: Dict[str, AsyncMock] = {}
+    
+    def get(name: str) -> AsyncMock:
+        service_cls, configure = _MOCK_SPECS[name]
+        mock = mocks.get(name)
+        if mock is None:
+            mock = mocks[name] = AsyncMock(spec=service_cls)
+        else:
+            mock.reset_mock(return_value=True, side_effect=True)
+        configure(mock)
+        return mock
+    
+    return get
+
+
+@pytest.fixture(params=list(_MOCK_SPECS))
+def mock_service(request: pytest.FixtureRequest, _mock_registry: Callable[[str], AsyncMock]) -> AsyncMock:
+    """Each mock service in turn, for tests of behaviour shared by all services."""
+    return _mock_registry(request.param)
 
 
 @pytest.fixture
-def mock_llm_service() -> AsyncMock:
+def mock_llm_service(_mock_registry: Callable[[str], AsyncMock]) -> AsyncMock:
     """Create a mock LLM service for testing."""
-    mock_service = AsyncMock(spec=LLMService)
-    mock_service.is_initialized.return_value = True
-    mock_service.generate_content.return_value = "Mock generated content"
-    mock_service.generate_learning_objectives.return_value = """
-    {
-        "objectives": [
-            {
-                "objective_text": "Students will be able to calculate force using Newton's second law",
-                "bloom_level": "apply",
-                "action_verbs": ["calculate", "solve"],
-                "difficulty": "intermediate",
-                "assessment_suggestions": ["problem solving", "laboratory work"]
-            }
-        ]
-    }
-    """
-    mock_service.validate_learning_objective.return_value = {
-        "overall_score": 0.85,
-        "clarity_score": 0.9,
-        "relevance_score": 0.8,
-        "structure_score": 0.85,
-        "feedback": "Well-structured learning objective"
-    }
-    mock_service.health_check.return_value = {
-        "status": "healthy",
-        "message": "Mock LLM service operational"
-    }
-    return mock_service
+    return _mock_registry("llm")
 
 
 @pytest.fixture
-def mock_vector_service() -> AsyncMock:
+def mock_vector_service(_mock_registry: Callable[[str], AsyncMock]) -> AsyncMock:
     """Create a mock vector service for testing."""
-    mock_service = AsyncMock(spec=VectorService)
-    mock_service.is_initialized.return_value = True
-    mock_service.generate_embedding.return_value = [0.1] * 1024  # Mock embedding
-    mock_service.index_chunk.return_value = True
-    mock_service.search_similar.return_value = [
-        {
-            "id": "test-chunk-1",
-            "score": 0.85,
-            "text": "Force is a push or pull that can change the motion of objects.",
-            "language": "en",
-            "metadata": {"source": "physics_textbook.pdf", "page": 1}
-        }
-    ]
-    mock_service.get_collection_stats.return_value = {
-        "vectors_count": 100,
-        "indexed_vectors_count": 100,
-        "points_count": 100
-    }
-    mock_service.health_check.return_value = {
-        "status": "healthy",
-        "qdrant": {"status": "healthy"},
-        "ollama": {"status": "healthy"}
-    }
-    return mock_service
+    return _mock_registry("vector")
 
 
 @pytest.fixture
-def mock_processing_service() -> AsyncMock:
+def mock_processing_service(_mock_registry: Callable[[str], AsyncMock]) -> AsyncMock:
     """Create a mock processing service for testing."""
-    mock_service = AsyncMock(spec=ProcessingService)
-    mock_service.is_initialized.return_value = True
-    mock_service.extract_text_from_pdf.return_value = {
-        "filename": "test.pdf",
-        "total_pages": 5,
-        "full_text": "This is test content about physics and forces.",
-        "document_language": "en",
-        "document_language_confidence": 0.95
-    }
-    mock_service.create_chunks.return_value = [
-        {
-            "chunk_id": "chunk-1",
-            "content": "This is test content about physics.",
-            "quality_score": 0.8,
-            "metadata": {
-                "source_document": "test.pdf",
-                "language_code": "en",
-                "language_confidence": 0.9
-            }
-        }
-    ]
-    mock_service.process_pdf_file.return_value = {
-        "source_file": "test.pdf",
-        "processing_successful": True,
-        "chunks": [
-            {
-                "chunk_id": "chunk-1",
-                "content": "This is test content about physics.",
-                "quality_score": 0.8,
-                "metadata": {"source_document": "test.pdf"}
-            }
-        ]
-    }
-    mock_service.health_check.return_value = {
-        "status": "healthy",
-        "message": "Mock processing service operational"
-    }
-    return mock_service
+    return _mock_registry("processing")
 
 
 @pytest.fixture
-def mock_generation_service() -> AsyncMock:
+def mock_generation_service(_mock_registry: Callable[[str], AsyncMock]) -> AsyncMock:
     """Create a mock generation service for testing."""
-    mock_service = AsyncMock(spec=GenerationService)
-    mock_service.is_initialized.return_value = True
-    mock_service.retrieve_context.return_value = {
-        "topic": "Forces and Motion",
-        "chunks": [
-            {
-                "id": "chunk-1",
-                "text": "Force is a push or pull that can change motion.",
-                "score": 0.85,
-                "language": "en"
-            }
-        ],
-        "context_text": "Force is a push or pull that can change motion.",
-        "total_chunks": 1,
-        "avg_relevance": 0.85
-    }
-    mock_service.generate_learning_objectives.return_value = {
-        "topic": "Forces and Motion",
-        "generation_successful": True,
-        "requested_count": 3,
-        "generated_count": 3,
-        "validated_count": 3,
-        "objectives": [
-            {
-                "objective_text": "Students will be able to identify different types of forces",
-                "bloom_level": "remember",
-                "quality_scores": {"overall_score": 0.8}
-            }
-        ],
-        "generation_stats": {
-            "avg_quality_score": 0.8,
-            "processing_time_seconds": 5.2
-        }
-    }
-    mock_service.health_check.return_value = {
-        "status": "healthy",
-        "message": "Mock generation service operational"
-    }
-    return mock_service
+    return _mock_registry("generation")
 
 
+# Plain fakes: cheaper than the AsyncMocks above when a test needs no call introspection
 @pytest.fixture
-def sample_physics_content() -> Dict[str, Any]:
-    """Sample physics content for testing."""
-    return {
+def fake_llm_service() -> FakeLLMService:
+    """Create a fake LLM service for testing."""
+    return FakeLLMService()
+
+
+@pytest.fixture
+def fake_vector_service() -> FakeVectorService:
+    """Create a fake vector service for testing."""
+    return FakeVectorService()
+
+
+@pytest.fixture
+def fake_processing_service() -> FakeProcessingService:
+    """Create a fake processing service for testing."""
+    return FakeProcessingService()
+
+
+@pytest.fixture
+def fake_generation_service() -> FakeGenerationService:
+    """Create a fake generation service for testing."""
+    return FakeGenerationService()
+
+
+# A real VectorService over Qdrant's in-process engine, with only Ollama's HTTP API faked
+@pytest_asyncio.fixture(loop_scope="session")
+async def memory_vector_service() -> AsyncGenerator[VectorService, None]:
+    """Vector service backed by an in-memory Qdrant collection and the fake Ollama API."""
+    service = VectorService()
+    service.qdrant_client = AsyncQdrantClient(":memory:")
+    service.ollama_client = fake_ollama.ollama_client()
+    service.collection_name = "test_collection"
+    await service._test_connections()
+    await service._ensure_collection()
+    service._initialized = True
+    yield service
+    await service.shutdown()
+
+
+@pytest.fixture(scope="session")
+def sample_physics_content() -> Mapping[str, Any]:
+    """Sample physics content for testing (read-only, shared across the session)."""
+    return MappingProxyType({
         "topic": "Forces and Motion",
         "content": """
         Force is a push or pull that can change the motion of an object. 
@@ -214,28 +225,54 @@ def sample_physics_content() -> Dict[str, Any]:
         """,
         "expected_chunks": 2,
         "expected_language": "en"
-    }
+    })
 
 
-@pytest.fixture
-def sample_learning_objectives() -> list:
-    """Sample learning objectives for testing."""
-    return [
-        {
+@pytest.fixture(scope="session")
+def sample_learning_objectives() -> Tuple[Mapping[str, Any], ...]:
+    """Sample learning objectives for testing (read-only, shared across the session)."""
+    return (
+        MappingProxyType({
             "objective_text": "Students will be able to calculate force using F=ma",
             "bloom_level": "apply",
-            "action_verbs": ["calculate", "solve"],
+            "action_verbs": ("calculate", "solve"),
             "difficulty": "intermediate",
-            "assessment_suggestions": ["problem solving"]
-        },
-        {
+            "assessment_suggestions": ("problem solving",)
+        }),
+        MappingProxyType({
             "objective_text": "Students will be able to explain Newton's first law",
             "bloom_level": "understand",
-            "action_verbs": ["explain", "describe"],
+            "action_verbs": ("explain", "describe"),
             "difficulty": "beginner",
-            "assessment_suggestions": ["written explanation"]
-        }
-    ]
+            "assessment_suggestions": ("written explanation",)
+        })
+    )
+
+
+@pytest.fixture(scope="session")
+def parsed_learning_objectives() -> Dict[str, Any]:
+    """The mock LLM's learning objectives response, already parsed (treat as read-only)."""
+    return fake_llm.LEARNING_OBJECTIVES_PARSED
+
+
+@pytest.fixture(scope="session")
+def frozen_now() -> datetime:
+    """Fixed "current" time used by timestamped sample data."""
+    return FIXED_NOW
+
+
+@pytest.fixture
+def chunk_factory() -> type:
+    """ChunkFactory with its sequence restarted, so chunk ids are deterministic per test."""
+    ChunkFactory.reset_sequence()
+    return ChunkFactory
+
+
+@pytest.fixture
+def objective_factory() -> type:
+    """ObjectiveFactory with its sequence restarted, so objectives are deterministic per test."""
+    ObjectiveFactory.reset_sequence()
+    return ObjectiveFactory
 
 
 @pytest.fixture
@@ -245,21 +282,62 @@ def api_test_client():
     pass
 
 
+# Real services, initialized once and shared by the integration tests
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _pipeline_services() -> AsyncGenerator[Tuple[ProcessingService, VectorService, GenerationService], None]:
+    """
+    Processing, vector and generation services, initialized once per session.
+    
+    They talk to independent backends, so start-up and shutdown run concurrently.
+    """
+    services = (ProcessingService(), VectorService(), GenerationService())
+    await asyncio.gather(*(service.initialize() for service in services))
+    yield services
+    await asyncio.gather(*(service.shutdown() for service in services))
+
+
+@pytest.fixture(scope="session")
+def processing_service(_pipeline_services) -> ProcessingService:
+    """Initialized processing service, shut down at session end."""
+    return _pipeline_services[0]
+
+
+@pytest.fixture(scope="session")
+def vector_service(_pipeline_services) -> VectorService:
+    """Initialized vector service, shut down at session end."""
+    return _pipeline_services[1]
+
+
+@pytest.fixture(scope="session")
+def generation_service(_pipeline_services) -> GenerationService:
+    """Initialized generation service, shut down at session end."""
+    return _pipeline_services[2]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def health_service() -> AsyncGenerator[HealthService, None]:
+    """Initialized health service, shut down at session end."""
+    service = HealthService()
+    await service.initialize()
+    yield service
+    await service.shutdown()
+
+
 # Performance test fixtures
-@pytest.fixture
-def performance_test_data():
-    """Data for performance testing."""
-    return {
+@pytest.fixture(scope="session")
+def performance_test_data() -> Mapping[str, Any]:
+    """Data for performance testing (read-only, shared across the session)."""
+    return MappingProxyType({
         "large_text": "This is test content. " * 1000,
-        "multiple_topics": [
+        "multiple_topics": (
             "Forces and Motion",
             "Energy Conservation", 
             "Wave Properties",
             "Electric Circuits",
             "Thermodynamics"
-        ] * 10,  # 50 topics total
+        ) * 10,  # 50 topics total
         "stress_test_count": 100
-    }
+    })
 
 
 # Integration test helpers
@@ -282,26 +360,82 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "e2e: mark test as an end-to-end test")
     config.addinivalue_line("markers", "performance: mark test as a performance test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
+    config.addinivalue_line("markers", "real_sleep: keep real time.sleep/asyncio.sleep in a unit test")
+
+
+_real_asyncio_sleep = asyncio.sleep
+
+
+async def _instant_sleep(delay: float, result: Any = None) -> Any:
+    """asyncio.sleep stand-in that still yields to the event loop once."""
+    await _real_asyncio_sleep(0)
+    return result
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make sleeps return immediately in unit tests (opt out with @pytest.mark.real_sleep)."""
+    if "unit" in request.keywords and "real_sleep" not in request.keywords:
+        monkeypatch.setattr(asyncio, "sleep", _instant_sleep)
+        monkeypatch.setattr(time, "sleep", lambda *_: None)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed, otherwise on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+# Test directory -> markers applied to every test collected from it
+_PATH_MARKER_PATTERN = re.compile(r"(?:^|/)(unit|integration|e2e|performance)/")
+_PATH_MARKERS = {
+    "unit": (pytest.mark.unit,),
+    "integration": (pytest.mark.integration,),
+    "e2e": (pytest.mark.e2e,),
+    "performance": (pytest.mark.performance, pytest.mark.slow),
+}
 
 
 def pytest_collection_modifyitems(config, items):
     """Modify test collection to add markers based on test paths."""
+    # Run every async test on the single session-wide event loop
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    # Markers depend only on the file's directory, so resolve each directory once
+    markers_by_dir: Dict[Path, Tuple[Any, ...]] = {}
     for item in items:
-        # Add markers based on test file location
-        if "unit" in item.nodeid:
-            item.add_marker(pytest.mark.unit)
-        elif "integration" in item.nodeid:
-            item.add_marker(pytest.mark.integration)
-        elif "e2e" in item.nodeid:
-            item.add_marker(pytest.mark.e2e)
-        elif "performance" in item.nodeid:
-            item.add_marker(pytest.mark.performance)
-            item.add_marker(pytest.mark.slow)
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+        
+        directory = item.path.parent
+        markers = markers_by_dir.get(directory)
+        if markers is None:
+            match = _PATH_MARKER_PATTERN.search(item.nodeid)
+            markers = markers_by_dir[directory] = _PATH_MARKERS[match.group(1)] if match else ()
+        for marker in markers:
+            item.add_marker(marker)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the event loop shared by `async_test`, if one was created."""
+    if _async_test_loop.cache_info().currsize:
+        _async_test_loop().close()
+        _async_test_loop.cache_clear()
 
 
 # Async test helpers
+@functools.lru_cache(maxsize=1)
+def _async_test_loop() -> asyncio.AbstractEventLoop:
+    """Event loop reused by every `async_test` call (asyncio.Runner needs 3.11+)."""
+    return asyncio.new_event_loop()
+
+
 def async_test(f):
     """Decorator to run async tests."""
+    @functools.wraps(f)
     def wrapper(*args, **kwargs):
-        return asyncio.get_event_loop().run_until_complete(f(*args, **kwargs))
+        return _async_test_loop().run_until_complete(f(*args, **kwargs))
     return wrapper
\ No newline at end of file
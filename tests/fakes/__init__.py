@@ -0,0 +1,17 @@
+"""
+Hand-written service fakes and the canned payloads they return.
+"""
+
+from .llm import FakeLLMService
+from .vector import FakeVectorService
+from .processing import FakeProcessingService
+from .generation import FakeGenerationService
+from .jobs import FakeJobService
+
+__all__ = [
+    "FakeLLMService",
+    "FakeVectorService",
+    "FakeProcessingService",
+    "FakeGenerationService",
+    "FakeJobService",
+]
@@ -0,0 +1,61 @@
+"""
+Fake learning objective generation service.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+CONTEXT = MappingProxyType({
+    "topic": "Forces and Motion",
+    "chunks": (
+        MappingProxyType({
+            "id": "chunk-1",
+            "text": "Force is a push or pull that can change motion.",
+            "score": 0.85,
+            "language": "en"
+        }),
+    ),
+    "context_text": "Force is a push or pull that can change motion.",
+    "total_chunks": 1,
+    "avg_relevance": 0.85
+})
+
+GENERATION_RESULT = MappingProxyType({
+    "topic": "Forces and Motion",
+    "generation_successful": True,
+    "requested_count": 3,
+    "generated_count": 3,
+    "validated_count": 3,
+    "objectives": (
+        MappingProxyType({
+            "objective_text": "Students will be able to identify different types of forces",
+            "bloom_level": "remember",
+            "quality_scores": MappingProxyType({"overall_score": 0.8})
+        }),
+    ),
+    "generation_stats": MappingProxyType({
+        "avg_quality_score": 0.8,
+        "processing_time_seconds": 5.2
+    })
+})
+
+HEALTH = MappingProxyType({
+    "status": "healthy",
+    "message": "Mock generation service operational"
+})
+
+
+class FakeGenerationService:
+    """Stand-in for GenerationService returning canned responses."""
+
+    def is_initialized(self) -> bool:
+        return True
+
+    async def retrieve_context(self, *args: Any, **kwargs: Any) -> MappingProxyType:
+        return CONTEXT
+
+    async def generate_learning_objectives(self, *args: Any, **kwargs: Any) -> MappingProxyType:
+        return GENERATION_RESULT
+
+    async def health_check(self) -> MappingProxyType:
+        return HEALTH
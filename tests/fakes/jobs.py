@@ -0,0 +1,26 @@
+"""
+Fake job orchestration service.
+"""
+
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Dict, List
+
+GENERATION_JOB = MappingProxyType({
+    "job_id": "test-job-123",
+    "status": "queued",
+    "processing_pipeline": ("direct_processing", "lo_generation"),
+    "estimated_completion": datetime(2025, 1, 1, 0, 5),
+    "cost_estimate": MappingProxyType({"total_cost_usd": 0.05})
+})
+
+
+class FakeJobService:
+    """Stand-in for JobService that records job requests and returns a canned job."""
+
+    def __init__(self) -> None:
+        self.created_jobs: List[Dict[str, Any]] = []
+
+    async def create_generation_job(self, **kwargs: Any) -> MappingProxyType:
+        self.created_jobs.append(kwargs)
+        return GENERATION_JOB
@@ -0,0 +1,57 @@
+"""
+Fake LLM service.
+"""
+
+import json
+from types import MappingProxyType
+from typing import Any, Dict
+
+GENERATED_CONTENT = "Mock generated content"
+
+# Raw learning objectives response, and its parsed form (parsed once at import)
+LEARNING_OBJECTIVES_RAW = """
+{
+    "objectives": [
+        {
+            "objective_text": "Students will be able to calculate force using Newton's second law",
+            "bloom_level": "apply",
+            "action_verbs": ["calculate", "solve"],
+            "difficulty": "intermediate",
+            "assessment_suggestions": ["problem solving", "laboratory work"]
+        }
+    ]
+}
+"""
+LEARNING_OBJECTIVES_PARSED: Dict[str, Any] = json.loads(LEARNING_OBJECTIVES_RAW)
+
+VALIDATION_RESULT = MappingProxyType({
+    "overall_score": 0.85,
+    "clarity_score": 0.9,
+    "relevance_score": 0.8,
+    "structure_score": 0.85,
+    "feedback": "Well-structured learning objective"
+})
+
+HEALTH = MappingProxyType({
+    "status": "healthy",
+    "message": "Mock LLM service operational"
+})
+
+
+class FakeLLMService:
+    """Stand-in for LLMService returning canned responses."""
+
+    def is_initialized(self) -> bool:
+        return True
+
+    async def generate_content(self, *args: Any, **kwargs: Any) -> str:
+        return GENERATED_CONTENT
+
+    async def generate_learning_objectives(self, *args: Any, **kwargs: Any) -> str:
+        return LEARNING_OBJECTIVES_RAW
+
+    async def validate_learning_objective(self, *args: Any, **kwargs: Any) -> MappingProxyType:
+        return VALIDATION_RESULT
+
+    async def health_check(self) -> MappingProxyType:
+        return HEALTH
@@ -0,0 +1,44 @@
+"""
+Fake Ollama HTTP API, served through httpx.MockTransport.
+"""
+
+import json
+import zlib
+from typing import List
+
+import httpx
+
+from .vector import EMBEDDING_DIMENSION
+
+BASE_URL = "http://ollama.test"
+
+
+def embed_text(text: str) -> List[float]:
+    """
+    Deterministic bag-of-words embedding of text.
+
+    Each lower-cased word adds 1.0 to a bucket chosen by its CRC32, so texts
+    sharing words have a positive cosine similarity.
+    """
+    vector = [0.0] * EMBEDDING_DIMENSION
+    for word in text.lower().split():
+        vector[zlib.crc32(word.encode("utf-8")) % EMBEDDING_DIMENSION] += 1.0
+    return vector
+
+
+def _handle(request: httpx.Request) -> httpx.Response:
+    """Answer the Ollama endpoints VectorService calls."""
+    if request.url.path == "/api/tags":
+        return httpx.Response(200, json={"models": []})
+
+    body = json.loads(request.content)
+    if request.url.path == "/api/embeddings":
+        return httpx.Response(200, json={"embedding": embed_text(body["prompt"])})
+    if request.url.path == "/api/embed":
+        return httpx.Response(200, json={"embeddings": [embed_text(text) for text in body["input"]]})
+    return httpx.Response(404)
+
+
+def ollama_client() -> httpx.AsyncClient:
+    """An httpx client whose requests are answered by the fake Ollama API."""
+    return httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(_handle))
@@ -0,0 +1,64 @@
+"""
+Fake document processing service.
+"""
+
+from types import MappingProxyType
+from typing import Any, Tuple
+
+EXTRACTED_TEXT = MappingProxyType({
+    "filename": "test.pdf",
+    "total_pages": 5,
+    "full_text": "This is test content about physics and forces.",
+    "document_language": "en",
+    "document_language_confidence": 0.95
+})
+
+CHUNKS: Tuple[MappingProxyType, ...] = (
+    MappingProxyType({
+        "chunk_id": "chunk-1",
+        "content": "This is test content about physics.",
+        "quality_score": 0.8,
+        "metadata": MappingProxyType({
+            "source_document": "test.pdf",
+            "language_code": "en",
+            "language_confidence": 0.9
+        })
+    }),
+)
+
+PROCESSED_PDF = MappingProxyType({
+    "source_file": "test.pdf",
+    "processing_successful": True,
+    "chunks": (
+        MappingProxyType({
+            "chunk_id": "chunk-1",
+            "content": "This is test content about physics.",
+            "quality_score": 0.8,
+            "metadata": MappingProxyType({"source_document": "test.pdf"})
+        }),
+    )
+})
+
+HEALTH = MappingProxyType({
+    "status": "healthy",
+    "message": "Mock processing service operational"
+})
+
+
+class FakeProcessingService:
+    """Stand-in for ProcessingService returning canned responses."""
+
+    def is_initialized(self) -> bool:
+        return True
+
+    async def extract_text_from_pdf(self, *args: Any, **kwargs: Any) -> MappingProxyType:
+        return EXTRACTED_TEXT
+
+    async def create_chunks(self, *args: Any, **kwargs: Any) -> Tuple[MappingProxyType, ...]:
+        return CHUNKS
+
+    async def process_pdf_file(self, *args: Any, **kwargs: Any) -> MappingProxyType:
+        return PROCESSED_PDF
+
+    async def health_check(self) -> MappingProxyType:
+        return HEALTH
@@ -0,0 +1,61 @@
+"""
+Fake vector service.
+"""
+
+from types import MappingProxyType
+from typing import Any, Tuple
+
+import numpy as np
+
+EMBEDDING_DIMENSION = 1024
+EMBEDDING_VALUE = 0.1
+
+SEARCH_RESULTS: Tuple[MappingProxyType, ...] = (
+    MappingProxyType({
+        "id": "test-chunk-1",
+        "score": 0.85,
+        "text": "Force is a push or pull that can change the motion of objects.",
+        "language": "en",
+        "metadata": MappingProxyType({"source": "physics_textbook.pdf", "page": 1})
+    }),
+)
+
+COLLECTION_STATS = MappingProxyType({
+    "vectors_count": 100,
+    "indexed_vectors_count": 100,
+    "points_count": 100
+})
+
+_HEALTHY = MappingProxyType({"status": "healthy"})
+HEALTH = MappingProxyType({
+    "status": "healthy",
+    "qdrant": _HEALTHY,
+    "ollama": _HEALTHY
+})
+
+
+def mock_embedding() -> np.ndarray:
+    """A fresh constant float32 embedding vector."""
+    return np.full(EMBEDDING_DIMENSION, EMBEDDING_VALUE, dtype=np.float32)
+
+
+class FakeVectorService:
+    """Stand-in for VectorService returning canned responses."""
+
+    def is_initialized(self) -> bool:
+        return True
+
+    async def generate_embedding(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        return mock_embedding()
+
+    async def index_chunk(self, *args: Any, **kwargs: Any) -> bool:
+        return True
+
+    async def search_similar(self, *args: Any, **kwargs: Any) -> Tuple[MappingProxyType, ...]:
+        return SEARCH_RESULTS
+
+    async def get_collection_stats(self) -> MappingProxyType:
+        return COLLECTION_STATS
+
+    async def health_check(self) -> MappingProxyType:
+        return HEALTH
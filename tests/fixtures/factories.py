@@ -0,0 +1,63 @@
+"""
+factory_boy factories for chunk and learning objective test data.
+"""
+
+import factory
+
+from .test_data import BLOOM_LEVELS, DIFFICULTIES
+
+
+# Subclassing factory.Factory with model=dict (rather than DictFactory) gives each
+# factory its own sequence counter instead of one shared by every DictFactory.
+
+class ChunkMetadataFactory(factory.Factory):
+    """Metadata block of a test chunk."""
+
+    class Meta:
+        model = dict
+
+    chunk_index = 0
+    source_document = factory.LazyAttribute(lambda o: f"test_doc_{o.chunk_index // 5}.pdf")
+    language_code = "en"
+    language_confidence = factory.LazyAttribute(lambda o: 0.9 + (o.chunk_index % 10) * 0.01)
+
+
+class ChunkFactory(factory.Factory):
+    """Test chunk, shaped like the output of `create_test_chunks`."""
+
+    class Meta:
+        model = dict
+
+    class Params:
+        index = factory.Sequence(lambda n: n)
+        content_template = "This is test chunk content number {index} about physics concepts."
+
+    chunk_id = factory.LazyAttribute(lambda o: f"test-chunk-{o.index:03d}")
+    content = factory.LazyAttribute(lambda o: o.content_template.format(index=o.index))
+    quality_score = factory.LazyAttribute(lambda o: 0.7 + (o.index % 3) * 0.1)
+    metadata = factory.SubFactory(ChunkMetadataFactory, chunk_index=factory.SelfAttribute("..index"))
+
+
+class ObjectiveFactory(factory.Factory):
+    """Test learning objective, shaped like the output of `create_test_objectives`."""
+
+    class Meta:
+        model = dict
+
+    class Params:
+        index = factory.Sequence(lambda n: n)
+        topic = "Test Topic"
+
+    bloom_level = factory.LazyAttribute(lambda o: BLOOM_LEVELS[o.index % len(BLOOM_LEVELS)])
+    objective_text = factory.LazyAttribute(
+        lambda o: f"Students will be able to {o.bloom_level} concepts related to {o.topic} (objective {o.index + 1})"
+    )
+    action_verbs = factory.LazyAttribute(lambda o: [o.bloom_level])
+    difficulty = factory.LazyAttribute(lambda o: DIFFICULTIES[o.index % len(DIFFICULTIES)])
+    assessment_suggestions = factory.LazyFunction(lambda: ["test", "assignment"])
+    quality_scores = factory.LazyAttribute(lambda o: {
+        "clarity_score": 0.8 + (o.index % 5) * 0.04,
+        "relevance_score": 0.75 + (o.index % 4) * 0.05,
+        "measurability_score": 0.7 + (o.index % 6) * 0.05,
+        "overall_score": 0.75 + (o.index % 5) * 0.05
+    })
@@ -0,0 +1,47 @@
+"""
+Router-only FastAPI apps shared by the API integration tests.
+
+Routers are imported lazily so a router that fails to import only breaks the
+tests that use it, not collection of the whole module.
+"""
+
+from functools import lru_cache
+
+from fastapi import APIRouter, FastAPI
+
+
+def _router_app(router: APIRouter, prefix: str) -> FastAPI:
+    """Build an app serving a single router, without OpenAPI/docs routes."""
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
+    app.include_router(router, prefix=prefix)
+    return app
+
+
+@lru_cache(maxsize=None)
+def make_health_app() -> FastAPI:
+    from src.api.v1.endpoints.health import router
+    return _router_app(router, "/api/v1/health")
+
+
+@lru_cache(maxsize=None)
+def make_config_app() -> FastAPI:
+    from src.api.v1.endpoints.config import router
+    return _router_app(router, "/api/v1")
+
+
+@lru_cache(maxsize=None)
+def make_monitoring_app() -> FastAPI:
+    from src.api.v1.endpoints.monitoring import router
+    return _router_app(router, "/api/v1")
+
+
+@lru_cache(maxsize=None)
+def make_learning_objectives_app() -> FastAPI:
+    from src.api.v1.endpoints.learning_objectives import router
+    return _router_app(router, "/api/v1")
+
+
+@lru_cache(maxsize=None)
+def make_rate_limits_app() -> FastAPI:
+    from src.api.v1.endpoints.rate_limits import router
+    return _router_app(router, "/api/v1")
@@ -2,17 +2,71 @@
 Performance tests for the Learning Objectives Generation Pipeline.
 """
 
+import os
+import random
 import pytest
 import asyncio
 import time
-from unittest.mock import AsyncMock, MagicMock
+import numpy as np
 from typing import List, Dict, Any
-import statistics
 
-from src.services.llm_service import LLMService
 from src.services.vector_service import VectorService
-from src.services.processing_service import ProcessingService
 from src.api.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from tests.fakes import FakeLLMService, FakeVectorService, FakeProcessingService
+
+
+# Sustained load schedule: light/medium/heavy requests in a fixed round-robin
+SUSTAINED_LOAD_SECONDS = 10
+SUSTAINED_LOAD_RPS = 20
+SUSTAINED_LOAD_DURATIONS = np.resize(
+    np.array([0.1, 0.3, 0.8]), SUSTAINED_LOAD_SECONDS * SUSTAINED_LOAD_RPS
+)
+
+# Mock embeddings are int8-quantised like a production vector store would hold them:
+# 1 byte per dimension, dequantised as value * MOCK_EMBEDDING_SCALE (25 * 0.004 = 0.1)
+MOCK_EMBEDDING_SCALE = 0.004
+MOCK_EMBEDDING = np.full(1024, 25, dtype=np.int8)
+MOCK_EMBEDDING.setflags(write=False)  # Shared by every mock result, never copied
+
+
+def _latency_percentiles(latencies) -> Dict[str, float]:
+    """Min, p50, p95, p99 and max of a latency sample, from a single np.percentile call."""
+    p0, p50, p95, p99, p100 = np.percentile(
+        np.asarray(latencies, dtype=np.float64), [0, 50, 95, 99, 100]
+    )
+    return {"min": p0, "p50": p50, "p95": p95, "p99": p99, "max": p100}
+
+
+def _rss_mb() -> float:
+    """Resident set size of this process in MB, read straight from procfs on Linux."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        import psutil
+        return psutil.Process().memory_info().rss / 1024 / 1024
+
+
+def _unit_rows(rng: np.random.Generator, rows: int, dim: int = 1024) -> np.ndarray:
+    """Contiguous float32 matrix of L2-normalised random rows, so dot products are cosines."""
+    matrix = rng.standard_normal((rows, dim), dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix
+
+
+def _rank_topk(query: np.ndarray, corpus: np.ndarray, k: int):
+    """Indices and cosine scores of the k corpus rows closest to `query`, best first."""
+    scores = corpus @ query
+    top = np.argpartition(scores, -k)[-k:]
+    top = top[np.argsort(scores[top])[::-1]]
+    return top, scores[top]
+
+
+async def _bench(make_call, num_calls: int) -> float:
+    """Seconds taken to run `num_calls` calls of `make_call()` under a single gather."""
+    start_ns = time.perf_counter_ns()
+    await asyncio.gather(*(make_call() for _ in range(num_calls)))
+    return (time.perf_counter_ns() - start_ns) / 1e9
 
 
 @pytest.mark.performance
@@ -22,7 +76,7 @@ class TestLLMServicePerformance:
     @pytest.fixture
     def mock_llm_service(self):
         """Create mock LLM service with realistic delays."""
-        service = AsyncMock(spec=LLMService)
+        service = FakeLLMService()
         
         async def mock_generate_content(prompt, **kwargs):
             # Simulate realistic API response time (0.5-2.0 seconds)
@@ -38,14 +92,13 @@ class TestLLMServicePerformance:
         num_requests = 10
         prompts = [f"Generate learning objective for topic {i}" for i in range(num_requests)]
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Run requests concurrently
         tasks = [mock_llm_service.generate_content(prompt) for prompt in prompts]
         results = await asyncio.gather(*tasks)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Performance assertions
         assert len(results) == num_requests
@@ -64,30 +117,37 @@ class TestLLMServicePerformance:
     async def test_llm_request_latency(self, mock_llm_service):
         """Test LLM request latency distribution."""
         num_samples = 20
-        latencies = []
+        loop = asyncio.get_running_loop()
         
-        for i in range(num_samples):
-            start_time = time.time()
+        async def timed_request(i):
+            start_time = loop.time()
             await mock_llm_service.generate_content(f"Test prompt {i}")
-            latency = time.time() - start_time
-            latencies.append(latency)
+            return loop.time() - start_time
+        
+        # Sample all requests concurrently; each one is timed individually
+        latencies = np.fromiter(
+            await asyncio.gather(*(timed_request(i) for i in range(num_samples))),
+            dtype=np.float64,
+            count=num_samples
+        )
         
         # Calculate statistics
-        avg_latency = statistics.mean(latencies)
-        median_latency = statistics.median(latencies)
-        max_latency = max(latencies)
-        min_latency = min(latencies)
+        avg_latency = latencies.mean()
+        stats = _latency_percentiles(latencies)
         
         # Performance assertions
         assert avg_latency < 2.0  # Average under 2 seconds
-        assert max_latency < 3.0  # Max under 3 seconds
-        assert min_latency > 0.5  # Min over 0.5 seconds (realistic)
+        assert stats["max"] < 3.0  # Max under 3 seconds
+        assert stats["min"] > 0.5  # Min over 0.5 seconds (realistic)
+        assert stats["p95"] < 1.5  # Tail under 1.5 seconds
         
         print(f"LLM Latency Statistics:")
         print(f"  Average: {avg_latency:.3f}s")
-        print(f"  Median: {median_latency:.3f}s")
-        print(f"  Min: {min_latency:.3f}s")
-        print(f"  Max: {max_latency:.3f}s")
+        print(f"  Median: {stats['p50']:.3f}s")
+        print(f"  P95: {stats['p95']:.3f}s")
+        print(f"  P99: {stats['p99']:.3f}s")
+        print(f"  Min: {stats['min']:.3f}s")
+        print(f"  Max: {stats['max']:.3f}s")
 
 
 @pytest.mark.performance
@@ -97,27 +157,45 @@ class TestVectorServicePerformance:
     @pytest.fixture
     def mock_vector_service(self):
         """Create mock vector service with realistic performance."""
-        service = AsyncMock(spec=VectorService)
+        service = FakeVectorService()
         
         async def mock_generate_embedding(text, language="en"):
             # Simulate embedding generation (0.1-0.3 seconds)
             await asyncio.sleep(0.15)
-            return [0.1] * 1024  # Mock embedding vector
+            return MOCK_EMBEDDING  # Mock embedding vector
+        
+        async def mock_generate_embeddings(texts, language="en", batch_size=32):
+            # One request per batch: fixed round-trip cost plus a small per-text cost
+            embeddings = []
+            for start in range(0, len(texts), batch_size):
+                batch = texts[start:start + batch_size]
+                await asyncio.sleep(0.15 + 0.002 * len(batch))
+                embeddings.extend(MOCK_EMBEDDING for _ in batch)
+            return embeddings
+        
+        rng = np.random.default_rng(0)
+        corpus = _unit_rows(rng, 1000)
+        query_embedding = _unit_rows(rng, 1)[0]
+        
+        # The query is fixed, so rank once; any smaller limit is a prefix of the top 100
+        top, scores = _rank_topk(query_embedding, corpus, 100)
+        ranked_results = [
+            {
+                "id": f"chunk-{i}",
+                "score": float(score),
+                "text": f"Similar content {i}",
+                "metadata": {"source": f"doc_{i}"}
+            }
+            for i, score in zip(top.tolist(), scores.tolist())
+        ]
         
         async def mock_search_similar(query_text, limit=10, **kwargs):
             # Simulate vector search (0.05-0.2 seconds)
             await asyncio.sleep(0.08)
-            return [
-                {
-                    "id": f"chunk-{i}",
-                    "score": 0.9 - (i * 0.05),
-                    "text": f"Similar content {i}",
-                    "metadata": {"source": f"doc_{i}"}
-                }
-                for i in range(limit)
-            ]
+            return ranked_results[:limit]
         
         service.generate_embedding = mock_generate_embedding
+        service.generate_embeddings = mock_generate_embeddings
         service.search_similar = mock_search_similar
         return service
     
@@ -126,27 +204,60 @@ class TestVectorServicePerformance:
         """Test batch embedding generation performance."""
         texts = [f"This is test content number {i} for embedding" for i in range(50)]
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
-        # Generate embeddings concurrently
-        tasks = [mock_vector_service.generate_embedding(text) for text in texts]
-        embeddings = await asyncio.gather(*tasks)
+        # Generate embeddings in batched requests
+        embeddings = await mock_vector_service.generate_embeddings(texts)
         
-        end_time = time.time()
-        total_time = end_time - start_time
+        total_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Performance assertions
         assert len(embeddings) == 50
         assert total_time < 5.0  # Should complete within 5 seconds
         
         throughput = len(texts) / total_time
-        assert throughput > 10.0  # At least 10 embeddings per second
+        assert throughput > 100.0  # At least 100 embeddings per second
         
         print(f"Batch Embedding Performance:")
         print(f"  Total time: {total_time:.2f}s")
         print(f"  Throughput: {throughput:.2f} embeddings/s")
         print(f"  Average per embedding: {total_time/len(texts):.3f}s")
     
+    @pytest.mark.asyncio
+    async def test_length_bucketed_embedding_batches(self):
+        """Test length bucketing in the real batch path against unsorted batches."""
+        service = VectorService()
+        # One batch at a time, so the comparison measures bucketing rather than concurrency
+        service.settings = service.settings.model_copy(update={"embedding_concurrency": 1})
+        batch_size = service.settings.embedding_batch_size
+        
+        rng = random.Random(42)
+        texts = ["x" * rng.randint(10, 4000) for _ in range(8 * batch_size)]
+        
+        async def padded_embed_batch(batch, language):
+            # Server cost scales with the batch padded to its longest input
+            await asyncio.sleep(len(batch) * max(map(len, batch)) * 1e-6)
+            return [[float(len(text))] for text in batch]
+        
+        service._embed_batch = padded_embed_batch
+        
+        start_ns = time.perf_counter_ns()
+        for start in range(0, len(texts), batch_size):
+            await service._embed_batch(texts[start:start + batch_size], "en")
+        unsorted_time = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        start_ns = time.perf_counter_ns()
+        embeddings = await service.generate_embeddings(texts)
+        bucketed_time = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        # Results come back in input order
+        assert embeddings == [[float(len(text))] for text in texts]
+        assert bucketed_time < unsorted_time * 0.8
+        
+        print(f"Length Bucketing Performance:")
+        print(f"  Unsorted batches: {unsorted_time:.2f}s")
+        print(f"  Bucketed batches: {bucketed_time:.2f}s")
+    
     @pytest.mark.asyncio
     async def test_vector_search_performance(self, mock_vector_service):
         """Test vector search performance with different result sizes."""
@@ -154,15 +265,43 @@ class TestVectorServicePerformance:
         result_sizes = [5, 10, 20, 50]
         
         for size in result_sizes:
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             results = await mock_vector_service.search_similar(query, limit=size)
-            search_time = time.time() - start_time
+            search_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Performance assertions
             assert len(results) == size
             assert search_time < 0.5  # Should be fast
             
             print(f"Vector Search (limit={size}): {search_time:.3f}s")
+    
+    def test_vector_search_simd(self):
+        """Test vectorised cosine ranking against a pure-Python reference."""
+        rng = np.random.default_rng(1)
+        corpus = _unit_rows(rng, 10_000)
+        query = _unit_rows(rng, 1)[0]
+        k = 10
+        
+        start_ns = time.perf_counter_ns()
+        top, scores = _rank_topk(query, corpus, k)
+        vectorised_time = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        query_list = query.tolist()
+        corpus_lists = corpus.tolist()
+        start_ns = time.perf_counter_ns()
+        reference_scores = [sum(q * c for q, c in zip(query_list, row)) for row in corpus_lists]
+        reference_top = sorted(
+            range(len(reference_scores)), key=reference_scores.__getitem__, reverse=True
+        )[:k]
+        python_time = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        assert top.tolist() == reference_top
+        assert np.allclose(scores, [reference_scores[i] for i in reference_top], atol=1e-5)
+        assert python_time > vectorised_time * 10
+        
+        print(f"Cosine top-{k} over {corpus.shape[0]}x{corpus.shape[1]}:")
+        print(f"  Vectorised: {vectorised_time * 1000:.2f}ms")
+        print(f"  Pure Python: {python_time * 1000:.2f}ms")
 
 
 @pytest.mark.performance
@@ -172,20 +311,22 @@ class TestProcessingServicePerformance:
     @pytest.fixture
     def mock_processing_service(self):
         """Create mock processing service."""
-        service = AsyncMock(spec=ProcessingService)
+        service = FakeProcessingService()
         
         async def mock_process_content(content, **kwargs):
             # Simulate content processing time based on content size
             processing_time = len(content) / 10000.0  # 10k chars per second
             await asyncio.sleep(min(processing_time, 2.0))  # Max 2 seconds
             
-            # Return mock chunks
+            # Return mock chunks as (start, end) ranges into the shared content,
+            # sliced only on demand
             chunk_count = max(1, len(content) // 1000)
             return {
                 "chunks": [
                     {
                         "id": f"chunk-{i}",
-                        "content": content[i*1000:(i+1)*1000],
+                        "range": (i * 1000, (i + 1) * 1000),
+                        "source": content,
                         "metadata": {"chunk_index": i}
                     }
                     for i in range(chunk_count)
@@ -201,22 +342,34 @@ class TestProcessingServicePerformance:
         """Test content processing performance with different content sizes."""
         content_sizes = [1000, 5000, 10000, 25000]  # Characters
         
+        # Build the largest document once; each size is a prefix of whole sentences
+        base_line = "This is test content. "
+        master_content = base_line * (max(content_sizes) // 20)
+        
         for size in content_sizes:
-            content = "This is test content. " * (size // 20)  # Approximate size
+            content = master_content[:size // 20 * len(base_line)]  # Approximate size
             
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             result = await mock_processing_service.process_content(content)
-            processing_time = time.time() - start_time
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Performance assertions
             assert len(result["chunks"]) > 0
             assert processing_time < 3.0  # Max 3 seconds for any size
             
+            # Chunks reference the input instead of copying it
+            assert all(chunk["source"] is content for chunk in result["chunks"])
+            start, end = result["chunks"][0]["range"]
+            assert result["chunks"][0]["source"][start:end] == content[:1000]
+            
             # Calculate processing rate
             chars_per_second = len(content) / processing_time
             assert chars_per_second > 1000  # At least 1k chars/second
             
-            print(f"Content Processing ({size} chars): {processing_time:.3f}s ({chars_per_second:.0f} chars/s)")
+            print(
+                f"Content Processing ({size} chars): {processing_time:.3f}s "
+                f"({chars_per_second:.0f} chars/s)"
+            )
 
 
 @pytest.mark.performance
@@ -246,16 +399,10 @@ class TestCircuitBreakerPerformance:
         # Measure baseline performance (direct calls)
         num_calls = 100
         
-        start_time = time.time()
-        for _ in range(num_calls):
-            await fast_function()
-        baseline_time = time.time() - start_time
+        baseline_time = await _bench(fast_function, num_calls)
         
         # Measure circuit breaker performance
-        start_time = time.time()
-        for _ in range(num_calls):
-            await circuit_breaker.call(fast_function)
-        circuit_time = time.time() - start_time
+        circuit_time = await _bench(lambda: circuit_breaker.call(fast_function), num_calls)
         
         # Calculate overhead
         overhead = (circuit_time - baseline_time) / baseline_time * 100
@@ -281,10 +428,11 @@ class TestCircuitBreakerPerformance:
         num_concurrent = 50
         num_batches = 5
         
-        total_start = time.time()
+        total_start_ns = time.perf_counter_ns()
+        batch_times_ns = []
         
         for batch in range(num_batches):
-            batch_start = time.time()
+            batch_start_ns = time.perf_counter_ns()
             
             tasks = [
                 circuit_breaker.call(mock_service_call)
@@ -292,7 +440,9 @@ class TestCircuitBreakerPerformance:
             ]
             results = await asyncio.gather(*tasks)
             
-            batch_time = time.time() - batch_start
+            batch_time_ns = time.perf_counter_ns() - batch_start_ns
+            batch_times_ns.append(batch_time_ns)
+            batch_time = batch_time_ns / 1e9
             throughput = num_concurrent / batch_time
             
             assert len(results) == num_concurrent
@@ -300,12 +450,19 @@ class TestCircuitBreakerPerformance:
             
             print(f"Batch {batch + 1}: {batch_time:.3f}s ({throughput:.0f} req/s)")
         
-        total_time = time.time() - total_start
+        total_time = (time.perf_counter_ns() - total_start_ns) / 1e9
         total_requests = num_concurrent * num_batches
         overall_throughput = total_requests / total_time
         
+        batch_stats = _latency_percentiles(np.asarray(batch_times_ns, dtype=np.int64) / 1e9)
+        
         print(f"Overall Performance: {overall_throughput:.0f} req/s")
-        assert overall_throughput > 15  # Minimum overall throughput
+        print(
+            f"  Batch time p50/p95/max: {batch_stats['p50']:.3f}s / "
+            f"{batch_stats['p95']:.3f}s / {batch_stats['max']:.3f}s"
+        )
+        # Serialised calls would cap out near 100 req/s (50 x 10ms per batch); leave CI headroom
+        assert overall_throughput > 200  # Breaker bookkeeping must not serialise the batch
 
 
 @pytest.mark.performance
@@ -316,11 +473,16 @@ class TestEndToEndPerformance:
     async def test_learning_objective_generation_pipeline(self):
         """Test complete LO generation pipeline performance."""
         # Mock the entire pipeline
-        async def mock_pipeline(topic: str, content: str):
-            # Simulate realistic pipeline stages
+        async def process_content():
             await asyncio.sleep(0.1)  # Content processing
+        
+        async def embed_and_retrieve():
             await asyncio.sleep(0.2)  # Vector embedding
-            await asyncio.sleep(0.3)  # Context retrieval
+            await asyncio.sleep(0.3)  # Context retrieval (needs the query embedding)
+        
+        async def mock_pipeline(topic: str, content: str):
+            # Simulate realistic pipeline stages; processing overlaps embedding and retrieval
+            await asyncio.gather(embed_and_retrieve(), process_content())
             await asyncio.sleep(0.8)  # LLM generation
             await asyncio.sleep(0.1)  # Validation
             
@@ -334,30 +496,31 @@ class TestEndToEndPerformance:
                     }
                     for _ in range(5)
                 ],
-                "generation_time": 1.5
+                "generation_time": 1.4
             }
         
         # Test single pipeline execution
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = await mock_pipeline("Forces and Motion", "Test content about physics")
-        single_time = time.time() - start_time
+        single_time = (time.perf_counter_ns() - start_ns) / 1e9
         
-        assert single_time < 3.0  # Should complete within 3 seconds
+        assert single_time < 1.5  # Critical path is 0.2+0.3+0.8+0.1s, below the 1.5s serial sum
         assert len(result["objectives"]) == 5
         
         # Test concurrent pipeline executions
         topics = [f"Physics Topic {i}" for i in range(5)]
         content = "Test content for physics learning objectives generation."
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         tasks = [mock_pipeline(topic, content) for topic in topics]
         results = await asyncio.gather(*tasks)
-        concurrent_time = time.time() - start_time
+        concurrent_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Performance assertions
         assert len(results) == 5
         assert concurrent_time < 5.0  # Should complete within 5 seconds
-        assert concurrent_time < single_time * 3  # Should be faster than sequential
+        # Serial execution would take 5x a single run; leave headroom for loaded CI runners
+        assert concurrent_time < single_time * 3  # Pipelines overlap
         
         print(f"Pipeline Performance:")
         print(f"  Single execution: {single_time:.2f}s")
@@ -368,62 +531,52 @@ class TestEndToEndPerformance:
     @pytest.mark.asyncio
     async def test_sustained_load_performance(self):
         """Test system performance under sustained load."""
-        async def mock_request():
-            # Simulate various request types with different load
-            request_type = hash(asyncio.current_task()) % 3
-            
-            if request_type == 0:  # Light request
-                await asyncio.sleep(0.1)
-            elif request_type == 1:  # Medium request
-                await asyncio.sleep(0.3)
-            else:  # Heavy request
-                await asyncio.sleep(0.8)
-            
-            return f"completed_type_{request_type}"
+        loop = asyncio.get_running_loop()
         
-        # Sustained load test parameters
-        duration_seconds = 10
-        requests_per_second = 20
-        total_requests = duration_seconds * requests_per_second
+        in_flight = asyncio.Semaphore(SUSTAINED_LOAD_RPS)
         
-        start_time = time.time()
-        completed_requests = 0
-        failed_requests = 0
+        async def mock_request(duration):
+            # Simulate the request's load
+            request_start = loop.time()
+            await asyncio.sleep(duration)
+            return loop.time() - request_start
         
-        # Generate load over time
-        for second in range(duration_seconds):
-            second_start = time.time()
-            
-            # Create batch of requests for this second
-            tasks = [mock_request() for _ in range(requests_per_second)]
+        async def bounded_request(index, duration):
+            # Admit on schedule against the monotonic loop clock to hold the target rate
+            await asyncio.sleep(max(0.0, start_time + index / SUSTAINED_LOAD_RPS - loop.time()))
             
+            # Each request gets its own deadline from when it starts,
+            # so one slow request is one failure
+            async with in_flight:
+                return await asyncio.wait_for(mock_request(duration), timeout=1.5)
+        
+        start_time = loop.time()
+        tasks = [
+            asyncio.ensure_future(bounded_request(index, duration))
+            for index, duration in enumerate(SUSTAINED_LOAD_DURATIONS.tolist())
+        ]
+        
+        # Tally completions as they stream in; timeouts and exceptions are failures
+        latencies = []
+        for next_done in asyncio.as_completed(tasks):
             try:
-                results = await asyncio.wait_for(
-                    asyncio.gather(*tasks, return_exceptions=True),
-                    timeout=2.0
-                )
-                
-                for result in results:
-                    if isinstance(result, Exception):
-                        failed_requests += 1
-                    else:
-                        completed_requests += 1
-            
-            except asyncio.TimeoutError:
-                failed_requests += requests_per_second
-            
-            # Rate limiting to maintain requests per second
-            second_duration = time.time() - second_start
-            if second_duration < 1.0:
-                await asyncio.sleep(1.0 - second_duration)
+                latencies.append(await next_done)
+            except Exception:
+                pass
+        total_time = loop.time() - start_time
+        
+        latencies = np.asarray(latencies, dtype=np.float64)
+        completed_requests = len(latencies)
+        failed_requests = len(tasks) - completed_requests
         
-        total_time = time.time() - start_time
-        success_rate = completed_requests / (completed_requests + failed_requests) * 100
+        success_rate = completed_requests / len(tasks) * 100
         actual_rps = completed_requests / total_time
+        p95_latency = _latency_percentiles(latencies)["p95"] if completed_requests else float("inf")
         
         # Performance assertions
         assert success_rate > 80  # At least 80% success rate
-        assert actual_rps > 10   # At least 10 successful requests per second
+        assert actual_rps > 18   # Close to the 20 req/s target
+        assert p95_latency < 1.0  # Heaviest simulated request is 0.8s
         
         print(f"Sustained Load Performance:")
         print(f"  Duration: {total_time:.1f}s")
@@ -431,6 +584,7 @@ class TestEndToEndPerformance:
         print(f"  Failed requests: {failed_requests}")
         print(f"  Success rate: {success_rate:.1f}%")
         print(f"  Actual RPS: {actual_rps:.1f}")
+        print(f"  P95 latency: {p95_latency:.3f}s")
 
 
 @pytest.mark.performance
@@ -439,37 +593,53 @@ class TestMemoryPerformance:
     
     def test_memory_usage_under_load(self):
         """Test memory usage doesn't grow excessively under load."""
-        import psutil
-        import gc
+        initial_memory = _rss_mb()
+        memory_samples = [initial_memory]
+        
+        # Struct-of-arrays window: 50 retained records plus up to 100 new ones
+        window_size, retained = 150, 50
+        embeddings = np.empty((window_size, MOCK_EMBEDDING.size), dtype=MOCK_EMBEDDING.dtype)
+        ids = np.empty(window_size, dtype=np.int64)
+        processed = np.zeros(window_size, dtype=bool)
+        count = 0
         
-        process = psutil.Process()
-        initial_memory = process.memory_info().rss / 1024 / 1024  # MB
+        # About 1 KB per record with int8 embeddings, against ~28 KB for a list of Python floats
+        record_bytes = (embeddings.nbytes + ids.nbytes + processed.nbytes) / window_size
+        assert record_bytes < 1.1 * 1024
         
         # Simulate memory-intensive operations
-        large_data = []
         for i in range(1000):
             # Create and process data
-            data = {
-                "id": i,
-                "content": "This is test content " * 100,
-                "embeddings": [0.1] * 1024,
-                "metadata": {"source": f"document_{i}", "processed": True}
-            }
-            large_data.append(data)
+            embeddings[count] = MOCK_EMBEDDING
+            ids[count] = i
+            processed[count] = True
+            count += 1
             
             # Simulate processing and cleanup
             if i % 100 == 0:
-                processed_data = [item for item in large_data if item["id"] < i - 50]
-                large_data = large_data[-50:]  # Keep only recent items
-                gc.collect()
+                processed_ids = ids[:count][ids[:count] < i - 50]
+                
+                # Keep only recent items, compacted to the front of the buffers
+                keep = min(count, retained)
+                embeddings[:keep] = embeddings[count - keep:count]
+                ids[:keep] = ids[count - keep:count]
+                processed[:keep] = processed[count - keep:count]
+                count = keep
+                
+                memory_samples.append(_rss_mb())
         
-        final_memory = process.memory_info().rss / 1024 / 1024  # MB
+        final_memory = _rss_mb()
+        memory_samples.append(final_memory)
         memory_growth = final_memory - initial_memory
+        peak_growth = np.max(memory_samples) - initial_memory
         
         # Memory assertions
-        assert memory_growth < 100  # Less than 100MB growth
+        assert memory_growth < 20  # Less than 20MB growth
+        assert peak_growth < 20  # No transient spike along the way either
         
         print(f"Memory Performance:")
         print(f"  Initial memory: {initial_memory:.1f} MB")
         print(f"  Final memory: {final_memory:.1f} MB")
         print(f"  Memory growth: {memory_growth:.1f} MB")
+        print(f"  Peak growth: {peak_growth:.1f} MB over {len(memory_samples)} samples")
+        print(f"  Bytes per record: {record_bytes:.0f}")
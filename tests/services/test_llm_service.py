@@ -4,7 +4,7 @@ Unit tests for LLM Service.
 
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from src.services.llm_service import LLMService
+from src.services.llm_service import LLMService, TokenBucket
 
 
 class TestLLMService:
@@ -49,6 +49,30 @@ class TestLLMService:
         assert result == "Generated learning objective content"
         mock_model.generate_content_async.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_generate_content_cache_hit(self):
+        """Test identical deterministic prompts are served from the response cache."""
+        service = LLMService()
+        
+        mock_response = MagicMock()
+        mock_response.text = "Cached learning objective content"
+        
+        mock_model = AsyncMock()
+        mock_model.generate_content_async.return_value = mock_response
+        
+        service.generation_model = mock_model
+        service._initialized = True
+        
+        first = await service.generate_content("Define force", temperature=0.0)
+        second = await service.generate_content("Define force", temperature=0.0)
+        
+        assert first == second == "Cached learning objective content"
+        mock_model.generate_content_async.assert_called_once()
+        
+        # Sampled (temperature > 0) requests always reach the API
+        await service.generate_content("Define force")
+        assert mock_model.generate_content_async.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_generate_content_empty_response(self):
         """Test handling of empty response from API."""
@@ -115,6 +139,8 @@ class TestLLMService:
         assert "clarity_score" in result
         assert "relevance_score" in result
         assert result["overall_score"] == 0.8  # Default from implementation
+        # Validation keeps the default sampling temperature, so it is not cached
+        assert "temperature" not in service.generate_content.call_args.kwargs
     
     @pytest.mark.asyncio
     async def test_rate_limiting(self):
@@ -142,6 +168,30 @@ class TestLLMService:
         assert len(results) == 15
         assert all(result == "Test response" for result in results)
     
+    @pytest.mark.asyncio
+    async def test_token_bucket_smooths_burst(self):
+        """Test token bucket spaces requests past the burst at the configured rate."""
+        rate, burst, calls = 200.0, 10, 100
+        bucket = TokenBucket(rate, burst)
+        loop = asyncio.get_running_loop()
+        
+        async def acquire():
+            await bucket.acquire()
+            return loop.time()
+        
+        start = loop.time()
+        granted = sorted(await asyncio.gather(*(acquire() for _ in range(calls))))
+        
+        # The burst is granted at once; the rest arrive no faster than 1/rate apart
+        assert granted[burst - 1] - start < 0.05
+        assert granted[-1] - granted[burst - 1] >= (calls - burst) / rate * 0.95
+    
+    @pytest.mark.parametrize("rate, burst", [(0, 10), (-1.0, 10), (5.0, 0)])
+    def test_token_bucket_rejects_invalid_limits(self, rate, burst):
+        """Test token bucket refuses limits that would stall or divide by zero."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate, burst)
+    
     @pytest.mark.asyncio
     async def test_health_check_healthy(self):
         """Test health check when service is healthy."""
@@ -2,9 +2,18 @@
 Unit tests for Vector Service.
 """
 
+import asyncio
+import uuid
+import numpy as np
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from src.services.vector_service import VectorService
+from unittest.mock import ANY, AsyncMock, patch, MagicMock
+from qdrant_client.http import models
+from src.services.vector_service import VectorService, rerank, _SEARCH_BREAKER_CONFIG
+from src.api.circuit_breaker import CircuitBreakerOpenException, circuit_registry
+
+# Qdrant point ids must be UUIDs or unsigned integers
+CHUNK_IDS = [str(uuid.UUID(int=i)) for i in range(1, 4)]
 
 
 class TestVectorService:
@@ -15,7 +24,7 @@ class TestVectorService:
         """Test vector service initialization."""
         service = VectorService()
         
-        with patch('qdrant_client.AsyncQdrantClient') as mock_qdrant, \
+        with patch('src.services.vector_service.AsyncQdrantClient') as mock_qdrant, \
              patch('httpx.AsyncClient') as mock_httpx:
             
             # Mock successful connections
@@ -31,6 +40,11 @@ class TestVectorService:
             assert service.is_initialized()
             assert service.qdrant_client is not None
             assert service.ollama_client is not None
+            
+            # Both clients are pooled for concurrent requests
+            assert mock_qdrant.call_args[1]["pool_size"] == service.settings.qdrant_pool_size
+            limits = mock_httpx.call_args[1]["limits"]
+            assert limits.max_connections == service.settings.ollama_max_connections
     
     @pytest.mark.asyncio
     async def test_language_detection(self):
@@ -77,9 +91,9 @@ class TestVectorService:
         # Mock Ollama client response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "embedding": [0.1, 0.2, 0.3] * 341 + [0.1]  # 1024 dimensions
-        }
+        })
         
         mock_client = AsyncMock()
         mock_client.post.return_value = mock_response
@@ -88,9 +102,41 @@ class TestVectorService:
         
         result = await service.generate_embedding("Test physics content", "en")
         
-        assert len(result) == 1024
-        assert all(isinstance(val, float) for val in result)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.float32
+        assert result.shape == (1024,)
+        mock_client.post.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_generate_embedding_cached(self):
+        """Test repeated embedding of the same text is served from the cache."""
+        service = VectorService()
+        
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = orjson.dumps({"embedding": [0.1] * 1024})
+        
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+        service.ollama_client = mock_client
+        service._initialized = True
+        
+        first = await service.generate_embedding("Test physics content", "en")
+        second = await service.generate_embedding("Test physics content", "en")
+        
+        assert second is first
         mock_client.post.assert_called_once()
+        
+        # Batch embedding reuses the cached vector and only sends the new text
+        new_embedding = np.full((1, 1024), 0.2, dtype=np.float32)
+        service._embed_batch = AsyncMock(return_value=new_embedding)
+        embeddings = await service.generate_embeddings(
+            ["Test physics content", "New content"], "en"
+        )
+        
+        assert embeddings[0] is first
+        assert np.array_equal(embeddings[1], new_embedding[0])
+        service._embed_batch.assert_called_once_with(["New content"], "en")
     
     @pytest.mark.asyncio
     async def test_generate_embedding_api_error(self):
@@ -110,30 +156,96 @@ class TestVectorService:
             await service.generate_embedding("Test content", "en")
     
     @pytest.mark.asyncio
-    async def test_index_chunk_success(self):
-        """Test successful chunk indexing."""
+    async def test_generate_embeddings_batches_requests(self):
+        """Test batch embedding splits input into embedding_batch_size requests."""
         service = VectorService()
+        service.settings = service.settings.model_copy(update={"embedding_batch_size": 2})
         
-        # Mock embedding generation
-        mock_embedding = [0.1] * 1024
-        service.generate_embedding = AsyncMock(return_value=mock_embedding)
+        # Echo one embedding per text so ordering can be checked
+        service._embed_batch = AsyncMock(
+            side_effect=lambda texts, language: [[float(len(text))] for text in texts]
+        )
         
-        # Mock Qdrant client
-        mock_qdrant = AsyncMock()
-        mock_qdrant.upsert.return_value = None
-        service.qdrant_client = mock_qdrant
-        service.collection_name = "test_collection"
+        embeddings = await service.generate_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+        
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert service._embed_batch.call_count == 3
+        assert service._embed_batch.call_args_list[-1][0][0] == ["eeeee"]
+    
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_bounded_concurrency(self):
+        """Test batch embedding runs batches concurrently up to embedding_concurrency."""
+        service = VectorService()
+        service.settings = service.settings.model_copy(
+            update={"embedding_batch_size": 1, "embedding_concurrency": 2}
+        )
+        
+        in_flight = peak = 0
+        
+        async def embed_batch(texts, language):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[float(len(text))] for text in texts]
+        
+        service._embed_batch = embed_batch
+        
+        embeddings = await service.generate_embeddings(["a", "bb", "ccc", "dddd", "eeeee"])
+        
+        assert embeddings == [[1.0], [2.0], [3.0], [4.0], [5.0]]
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_single_embed_request(self):
+        """Test batch embedding sends one /api/embed request and keeps input order."""
+        service = VectorService()
+        
+        def embed(url, json, timeout):
+            # One embedding per input, tagged with the input's length
+            response = MagicMock()
+            response.status_code = 200
+            response.content = orjson.dumps(
+                {"embeddings": [[float(len(text))] * 1024 for text in json["input"]]}
+            )
+            return response
+        
+        mock_client = AsyncMock()
+        mock_client.post.side_effect = embed
+        service.ollama_client = mock_client
         service._initialized = True
         
+        texts = ["Force changes motion", "Mass", "Acceleration is the rate of change of velocity"]
+        embeddings = await service.generate_embeddings(texts, "en")
+        
+        assert [embedding[0] for embedding in embeddings] == [float(len(text)) for text in texts]
+        mock_client.post.assert_called_once()
+        url, payload = mock_client.post.call_args[0][0], mock_client.post.call_args[1]["json"]
+        assert url == "/api/embed"
+        assert sorted(payload["input"]) == sorted(texts)
+        assert payload["model"] == "dengcao/Qwen3-Embedding-0.6B:F16"
+    
+    @pytest.mark.asyncio
+    async def test_index_chunk_success(self, memory_vector_service):
+        """Test successful chunk indexing."""
+        service = memory_vector_service
+        
         result = await service.index_chunk(
-            chunk_id="test-chunk-1",
+            chunk_id=CHUNK_IDS[0],
             text="Physics content about forces",
             metadata={"source": "textbook.pdf", "page": 1}
         )
         
         assert result is True
-        service.generate_embedding.assert_called_once()
-        mock_qdrant.upsert.assert_called_once()
+        [point] = await service.qdrant_client.retrieve(service.collection_name, [CHUNK_IDS[0]])
+        assert point.payload == {
+            "text": "Physics content about forces",
+            "language": "en",
+            "source": "textbook.pdf",
+            "page": 1
+        }
+        assert service.index_generation == 1
     
     @pytest.mark.asyncio
     async def test_index_chunk_failure(self):
@@ -151,68 +263,160 @@ class TestVectorService:
         )
         
         assert result is False
+        assert service.index_generation == 0
     
     @pytest.mark.asyncio
-    async def test_search_similar_success(self):
-        """Test successful similarity search."""
+    async def test_index_chunks_batches_by_language(self, memory_vector_service):
+        """Test batch indexing embeds once per language and upserts once."""
+        service = memory_vector_service
+        
+        with patch.object(
+            service, "generate_embeddings", wraps=service.generate_embeddings
+        ) as embed, patch.object(
+            service.qdrant_client, "upsert", wraps=service.qdrant_client.upsert
+        ) as upsert:
+            indexed = await service.index_chunks([
+                {"chunk_id": CHUNK_IDS[0], "text": "Force changes motion", "metadata": {"page": 1}},
+                {
+                    "chunk_id": CHUNK_IDS[1],
+                    "text": "Mass resists acceleration",
+                    "metadata": {"page": 1}
+                },
+                {"chunk_id": CHUNK_IDS[2], "text": "แรงคือการผลักหรือดึง", "metadata": {"page": 2}}
+            ])
+        
+        assert indexed == 3
+        assert embed.call_count == 2  # en + th
+        upsert.assert_called_once()
+        assert (await service.qdrant_client.count(service.collection_name)).count == 3
+    
+    @pytest.mark.asyncio
+    async def test_index_chunks_without_wait_then_flush(self):
+        """Test bulk batches are written without waiting and flushed once at the end."""
         service = VectorService()
         
-        # Mock embedding generation
-        mock_embedding = [0.1] * 1024
-        service.generate_embedding = AsyncMock(return_value=mock_embedding)
-        
-        # Mock Qdrant search results
-        mock_result = MagicMock()
-        mock_result.id = "chunk-1"
-        mock_result.score = 0.85
-        mock_result.payload = {
-            "text": "Physics content about forces",
-            "language": "en",
-            "source": "textbook.pdf"
-        }
+        service.generate_embeddings = AsyncMock(
+            side_effect=lambda texts, language: np.full((len(texts), 1024), 0.1, dtype=np.float32)
+        )
         
         mock_qdrant = AsyncMock()
-        mock_qdrant.search.return_value = [mock_result]
         service.qdrant_client = mock_qdrant
         service.collection_name = "test_collection"
         service._initialized = True
         
+        for page in range(3):
+            await service.index_chunks(
+                [{
+                    "chunk_id": f"chunk-{page}",
+                    "text": "Force changes motion",
+                    "metadata": {"page": page}
+                }],
+                wait=False
+            )
+        await service.flush()
+        
+        waits = [call[1]["wait"] for call in mock_qdrant.upsert.call_args_list]
+        assert waits == [False, False, False, True]
+        assert mock_qdrant.upsert.call_args[1]["points"] == []
+        assert service.index_generation == 4
+    
+    @pytest.mark.asyncio
+    async def test_index_chunks_failure(self):
+        """Test batch indexing failure."""
+        service = VectorService()
+        
+        service.generate_embeddings = AsyncMock(side_effect=Exception("Embedding failed"))
+        service._initialized = True
+        
+        indexed = await service.index_chunks([
+            {"chunk_id": "chunk-1", "text": "Physics content", "metadata": {}}
+        ])
+        
+        assert indexed == 0
+    
+    @pytest.mark.asyncio
+    async def test_search_similar_success(self, memory_vector_service):
+        """Test successful similarity search."""
+        service = memory_vector_service
+        await service.index_chunks([
+            {
+                "chunk_id": CHUNK_IDS[0],
+                "text": "Force is a push or pull",
+                "metadata": {"source": "textbook.pdf"}
+            },
+            {
+                "chunk_id": CHUNK_IDS[1],
+                "text": "Energy conservation in closed systems",
+                "metadata": {"source": "textbook.pdf"}
+            }
+        ])
+        
         results = await service.search_similar(
-            query_text="What is force?",
+            query_text="What is force",
             limit=5,
-            score_threshold=0.7
+            score_threshold=0.3
         )
         
         assert len(results) == 1
-        assert results[0]["id"] == "chunk-1"
-        assert results[0]["score"] == 0.85
-        assert results[0]["text"] == "Physics content about forces"
+        assert results[0]["id"] == CHUNK_IDS[0]
+        assert results[0]["score"] == pytest.approx(2 / np.sqrt(18), rel=1e-3)
+        assert results[0]["text"] == "Force is a push or pull"
         assert results[0]["language"] == "en"
+        assert results[0]["metadata"] == {"source": "textbook.pdf"}
     
     @pytest.mark.asyncio
-    async def test_search_similar_with_filters(self):
+    async def test_search_similar_with_filters(self, memory_vector_service):
         """Test similarity search with metadata filters."""
-        service = VectorService()
-        
-        # Mock embedding generation
-        service.generate_embedding = AsyncMock(return_value=[0.1] * 1024)
-        
-        # Mock Qdrant client
-        mock_qdrant = AsyncMock()
-        mock_qdrant.search.return_value = []
-        service.qdrant_client = mock_qdrant
-        service.collection_name = "test_collection"
-        service._initialized = True
+        service = memory_vector_service
+        await service.index_chunks([
+            {"chunk_id": CHUNK_IDS[0], "text": "forces", "metadata": {"source": "textbook.pdf"}},
+            {"chunk_id": CHUNK_IDS[1], "text": "forces", "metadata": {"source": "notes.pdf"}}
+        ])
         
-        await service.search_similar(
+        results = await service.search_similar(
             query_text="forces",
             filters={"source": "textbook.pdf", "language": "en"}
         )
         
-        # Verify that search was called with filters
-        mock_qdrant.search.assert_called_once()
-        call_args = mock_qdrant.search.call_args
-        assert call_args[1]["query_filter"] is not None
+        assert [result["id"] for result in results] == [CHUNK_IDS[0]]
+    
+    @pytest.mark.asyncio
+    async def test_search_similar_language_hint_skips_detection(self, memory_vector_service):
+        """Test a supplied language is used as-is without running detection."""
+        service = memory_vector_service
+        
+        with patch.object(service, "_detect_language") as detect:
+            await service.index_chunk(CHUNK_IDS[0], "forces", {}, language="th")
+            results = await service.search_similar(query_text="forces", language="th")
+        
+        detect.assert_not_called()
+        assert [result["language"] for result in results] == ["th"]
+    
+    def test_rerank_cosine_scores(self):
+        """Test reranking scores candidates by cosine similarity to the query."""
+        query = np.array([1.0, 0.0, 0.0], dtype=np.float32)
+        candidates = np.array([
+            [2.0, 0.0, 0.0],
+            [0.0, 3.0, 0.0],
+            [1.0, 1.0, 0.0],
+            [0.0, 0.0, 0.0]
+        ], dtype=np.float32)
+        
+        scores = rerank(query, candidates)
+        
+        assert scores.dtype == np.float32
+        np.testing.assert_allclose(scores, [1.0, 0.0, np.sqrt(0.5), 0.0], rtol=1e-6)
+    
+    def test_build_search_filter_cached(self):
+        """Test equal filter dicts reuse one built Qdrant filter."""
+        service = VectorService()
+        
+        search_filter = service._build_search_filter({"source": "textbook.pdf", "language": "en"})
+        
+        reordered = service._build_search_filter({"language": "en", "source": "textbook.pdf"})
+        assert reordered is search_filter
+        assert [c.key for c in search_filter.must] == ["language", "source"]
+        assert service._build_search_filter({}) is None
     
     @pytest.mark.asyncio
     async def test_search_similar_failure(self):
@@ -227,6 +431,60 @@ class TestVectorService:
         
         assert results == []
     
+    @pytest.mark.asyncio
+    async def test_search_similar_batch(self, memory_vector_service):
+        """Test batch similarity search sends every query in one query_batch_points call."""
+        service = memory_vector_service
+        await service.index_chunks([
+            {
+                "chunk_id": CHUNK_IDS[0],
+                "text": "force",
+                "metadata": {"source": "textbook.pdf", "page": 1}
+            },
+            {
+                "chunk_id": CHUNK_IDS[1],
+                "text": "momentum",
+                "metadata": {"source": "notes.pdf", "page": 2}
+            }
+        ])
+        
+        with patch.object(
+            service, "generate_embeddings", wraps=service.generate_embeddings
+        ) as embed, patch.object(
+            service.qdrant_client,
+            "query_batch_points",
+            wraps=service.qdrant_client.query_batch_points
+        ) as query:
+            results = await service.search_similar_batch(
+                ["force", "แรงคืออะไร", "momentum"],
+                limit=5,
+                filters={"source": "textbook.pdf"}
+            )
+        
+        assert [[result["id"] for result in r] for r in results] == [[CHUNK_IDS[0]], [], []]
+        assert results[0][0]["metadata"] == {"source": "textbook.pdf", "page": 1}
+        assert embed.call_count == 2  # en + th
+        query.assert_called_once()
+        requests = query.call_args[1]["requests"]
+        assert len(requests) == 3
+        assert all(request.limit == 5 and request.filter is not None for request in requests)
+    
+    @pytest.mark.asyncio
+    async def test_search_similar_batch_shares_search_breaker(self):
+        """An open qdrant_search breaker rejects batch searches before Qdrant is queried."""
+        service = VectorService()
+        service.qdrant_client = AsyncMock()
+        breaker = await circuit_registry.get_or_create("qdrant_search", _SEARCH_BREAKER_CONFIG)
+        await breaker._transition_to_open()
+        
+        try:
+            with pytest.raises(CircuitBreakerOpenException):
+                await service.search_similar_batch(["force"], language="en")
+        finally:
+            await breaker.reset()
+        
+        service.qdrant_client.query_batch_points.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_get_collection_stats(self):
         """Test collection statistics retrieval."""
@@ -285,6 +543,24 @@ class TestVectorService:
         assert health["qdrant"]["status"] == "healthy"
         assert health["ollama"]["status"] == "healthy"
     
+    @pytest.mark.asyncio
+    async def test_health_check_reports_each_subsystem(self, memory_vector_service):
+        """Test a failing Ollama probe marks only Ollama unhealthy."""
+        service = memory_vector_service
+        
+        unreachable = AsyncMock(side_effect=Exception("connection refused"))
+        with patch.object(service.ollama_client, "get", unreachable):
+            health = await service.health_check()
+        
+        assert health["status"] == "unhealthy"
+        assert health["qdrant"]["status"] == "healthy"
+        assert health["qdrant"]["collections_count"] == 1
+        assert health["ollama"] == {
+            "status": "unhealthy",
+            "error": "connection refused",
+            "models_available": []
+        }
+    
     @pytest.mark.asyncio
     async def test_health_check_unhealthy_not_initialized(self):
         """Test health check when service is not initialized."""
@@ -315,8 +591,11 @@ class TestVectorService:
         
         await service._ensure_collection()
         
-        # Verify collection creation was called
+        # Verify collection creation was called with int8 scalar quantization
         mock_qdrant.create_collection.assert_called_once_with(
             collection_name="test_collection",
-            vectors_config=pytest.mock.ANY
-        )
\ No newline at end of file
+            vectors_config=ANY,
+            quantization_config=ANY
+        )
+        quantization = mock_qdrant.create_collection.call_args[1]["quantization_config"]
+        assert quantization.scalar.type == models.ScalarType.INT8
\ No newline at end of file
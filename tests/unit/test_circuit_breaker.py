@@ -92,6 +92,7 @@ class TestCircuitBreaker:
         assert circuit_breaker_instance.stats.current_state == CircuitState.CLOSED
     
     @pytest.mark.asyncio
+    @pytest.mark.real_sleep
     async def test_timeout_request(self, circuit_breaker_instance, slow_function):
         """Test request timeout handling."""
         with pytest.raises(asyncio.TimeoutError):
@@ -113,6 +114,18 @@ class TestCircuitBreaker:
         assert circuit_breaker_instance.stats.current_state == CircuitState.OPEN
         assert circuit_breaker_instance.stats.failed_requests == 5
     
+    @pytest.mark.asyncio
+    async def test_failure_rate_window_bounded(self, circuit_breaker_instance, successful_function):
+        """Test the failure-rate window stays bounded under sustained traffic."""
+        for _ in range(10_000):
+            await circuit_breaker_instance.call(successful_function)
+        
+        stats = circuit_breaker_instance.stats
+        assert stats.total_requests == 10_000
+        assert len(stats.recent_successes) == stats.recent_successes.maxlen
+        assert len(stats.recent_failures) == 0
+        assert stats.current_state == CircuitState.CLOSED
+    
     @pytest.mark.asyncio
     async def test_circuit_rejection_when_open(self, circuit_breaker_instance, failing_function, successful_function):
         """Test request rejection when circuit is open."""
@@ -150,6 +163,7 @@ class TestCircuitBreaker:
         assert result == "fallback_result"
     
     @pytest.mark.asyncio
+    @pytest.mark.real_sleep
     async def test_circuit_half_open_transition(self, circuit_breaker_instance, failing_function):
         """Test transition from open to half-open state."""
         # Open the circuit
@@ -170,6 +184,7 @@ class TestCircuitBreaker:
         assert circuit_breaker_instance.stats.current_state == CircuitState.OPEN
     
     @pytest.mark.asyncio
+    @pytest.mark.real_sleep
     async def test_circuit_recovery(self, circuit_breaker_instance, failing_function, successful_function):
         """Test circuit recovery from open to closed state."""
         # Open the circuit
@@ -339,6 +354,24 @@ class TestCircuitBreakerDecorator:
         assert cb.config.success_threshold == 1
         assert cb.config.timeout == 0.5
     
+    @pytest.mark.asyncio
+    async def test_decorator_rejects_open_without_call(self, monkeypatch):
+        """Test an OPEN breaker rejects decorated calls before entering call()."""
+        @circuit_breaker(name="open_decorated_service", config=CircuitBreakerConfig(timeout=60.0))
+        async def decorated_function():
+            return "decorated_success"
+        
+        assert await decorated_function() == "decorated_success"
+        
+        cb = await circuit_registry.get_or_create("open_decorated_service")
+        await cb._transition_to_open()
+        call_spy = AsyncMock()
+        monkeypatch.setattr(cb, "call", call_spy)
+        
+        with pytest.raises(CircuitBreakerOpenException):
+            await decorated_function()
+        call_spy.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_decorator_with_fallback(self):
         """Test decorator with fallback function."""
@@ -0,0 +1,200 @@
+"""
+Unit tests for the Celery pipelines built by the job service.
+
+The chains run eagerly in-process; analysis, chunking, embedding and
+generation services are replaced with fakes and job state lives in a dict.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from celery import chain
+from celery.app.task import Task
+
+from src.services.document_analyzer import ProcessingPath
+from src.services.job_service import JobService
+from src.tasks import artifacts, generation_tasks, ocr_tasks, processing_tasks
+from src.tasks.celery_app import celery_app
+
+CONTENT = "# Kinematics\n\nVelocity is the rate of change of position."
+OCR_TEXT = "# Scanned page\n\nMomentum is mass times velocity."
+CHUNK_IDS = ["chunk-0", "chunk-1"]
+
+
+class FakeAnalyzer:
+    async def analyze_document(self, file_path, content_type):
+        return SimpleNamespace(
+            processing_path=ProcessingPath.STRUCTURAL,
+            metadata={'file_path': file_path, 'content_type': content_type},
+            quality_score=0.9,
+            estimated_processing_time=1.0,
+            recommendations=[]
+        )
+
+
+class FakeOCRService:
+    async def get_pdf_page_count(self, pdf_path):
+        return 1
+    
+    async def process_pdf_document(self, pdf_path, job_id, languages, max_concurrent_pages,
+                                   progress_callback):
+        return SimpleNamespace(
+            total_pages=1,
+            pages_processed=1,
+            average_confidence=0.95,
+            extracted_text=OCR_TEXT,
+            processing_time=0.1,
+            languages_detected=['eng'],
+            quality_assessment={},
+            page_results=[]
+        )
+
+
+class FakeChunkingService:
+    def __init__(self):
+        self.contents = []
+    
+    async def structural_chunk(self, content, chunk_config):
+        self.contents.append(content)
+        return [
+            SimpleNamespace(chunk_id=chunk_id, content=content, metadata={'token_count': 10})
+            for chunk_id in CHUNK_IDS
+        ]
+
+
+class FakeVectorService:
+    embedded = []
+    
+    async def generate_chunk_embeddings(self, chunk_ids):
+        self.embedded.extend(chunk_ids)
+
+
+class FakeGenerationService:
+    async def generate_learning_objectives(self, chunk_ids, config, progress_callback):
+        return [
+            SimpleNamespace(
+                lo_id=f"lo-{chunk_id}",
+                content=f"Explain {chunk_id}",
+                bloom_level="understand",
+                quality_score=0.8,
+                confidence=0.9,
+                source_chunk_id=chunk_id,
+                metadata={}
+            )
+            for chunk_id in chunk_ids
+        ]
+    
+    async def assess_generation_quality(self, los):
+        return {'overall_score': 0.8}
+
+
+@pytest.fixture
+def eager_celery(monkeypatch):
+    """Run tasks in-process and drop result-backend progress writes."""
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+    monkeypatch.setattr(celery_app.conf, "task_eager_propagates", True)
+    monkeypatch.setattr(Task, "update_state", lambda self, *args, **kwargs: None)
+
+
+@pytest.fixture
+def job_state(monkeypatch):
+    """Keep job stage results in a dict instead of the Redis hash."""
+    state = {}
+    
+    def save_job_state(job_id, stage, result):
+        state.setdefault(job_id, {})[stage] = result
+    
+    monkeypatch.setattr(processing_tasks, "save_job_state", save_job_state)
+    monkeypatch.setattr(processing_tasks, "load_job_state", lambda job_id: state.get(job_id, {}))
+    return state
+
+
+@pytest.fixture
+def fake_services(monkeypatch):
+    """Replace the services the processing and generation tasks call."""
+    chunking = FakeChunkingService()
+    FakeVectorService.embedded = []
+    monkeypatch.setattr(processing_tasks, "_document_analyzer", FakeAnalyzer)
+    monkeypatch.setattr(processing_tasks, "_chunking_service", lambda: chunking)
+    monkeypatch.setattr(processing_tasks, "VectorService", FakeVectorService)
+    monkeypatch.setattr(generation_tasks, "GenerationService", FakeGenerationService)
+    return SimpleNamespace(chunking=chunking, vector=FakeVectorService)
+
+
+@pytest.fixture
+def artifact_root(monkeypatch, temp_directory):
+    """Store job artifacts under a per-test directory."""
+    settings = SimpleNamespace(output_data_dir=str(temp_directory))
+    monkeypatch.setattr(artifacts, "get_settings", lambda: settings)
+    monkeypatch.setattr(ocr_tasks, "_ocr_service", FakeOCRService)
+    return temp_directory
+
+
+@pytest.mark.usefixtures("eager_celery")
+class TestJobPipelines:
+    """Each stage must accept the previous stage's result and pass ids on."""
+    
+    def test_direct_text_pipeline_runs(self, fake_services, job_state):
+        """Chunk ids flow from chunking through embedding into generation."""
+        pipeline = asyncio.run(JobService()._create_direct_text_pipeline(
+            "job-direct", CONTENT, {'model': 'gemini'}, {}
+        ))
+        
+        result = pipeline.apply().get()
+        
+        assert result['job_id'] == "job-direct"
+        assert [lo['source_chunk_id'] for lo in result['learning_objectives']] == CHUNK_IDS
+        assert fake_services.chunking.contents == [CONTENT]
+        assert fake_services.vector.embedded == CHUNK_IDS
+        assert job_state == {}
+    
+    def test_completed_pipeline_passes_chunk_ids_to_generation(self, fake_services, job_state):
+        """The processing path comes from analysis and chunk ids from the completion stage."""
+        job_id = "job-stateful"
+        pipeline = chain(
+            processing_tasks.analyze_document.s(
+                job_id=job_id,
+                file_path="notes.md",
+                content_type="markdown",
+                persist_state=True
+            ),
+            processing_tasks.process_content_chunks.s(
+                job_id=job_id,
+                content=CONTENT,
+                persist_state=True
+            ),
+            processing_tasks.generate_embeddings.s(job_id=job_id, persist_state=True),
+            processing_tasks.complete_processing_pipeline.s(job_id=job_id),
+            generation_tasks.generate_learning_objectives.s(
+                job_id=job_id,
+                generation_config={}
+            )
+        )
+        
+        result = pipeline.apply().get()
+        
+        assert result['generation_metadata']['total_chunks_processed'] == len(CHUNK_IDS)
+        assert set(job_state[job_id]) == {'analysis', 'chunks', 'embeddings'}
+        assert job_state[job_id]['chunks']['processing_summary']['processing_path'] == 'structural'
+    
+    def test_stage_without_chunk_ids_fails(self, fake_services):
+        """A stage that cannot find its input fails loudly instead of with a TypeError."""
+        with pytest.raises(ValueError, match="chunk_ids"):
+            processing_tasks.generate_embeddings.s(job_id="job-empty").apply().get()
+    
+    def test_pdf_pipeline_round_trips_ocr_text(self, fake_services, job_state, artifact_root):
+        """OCR text reaches chunking by URI and the job's artifacts are removed at the end."""
+        job_id = "job-pdf"
+        pdf_path = artifact_root / "upload.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4")
+        pipeline = asyncio.run(JobService()._create_pdf_upload_pipeline(
+            job_id, str(pdf_path), {}, {}
+        ))
+        
+        result = pipeline.apply().get()
+        
+        assert fake_services.chunking.contents == [OCR_TEXT]
+        assert result['artifacts_removed'] is True
+        assert not (artifact_root / "jobs" / job_id).exists()
+        assert pdf_path.exists()